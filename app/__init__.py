@@ -37,6 +37,7 @@ def create_app():
     app.config['FIREBASE_MESSAGING_SENDER_ID'] = os.getenv('FIREBASE_MESSAGING_SENDER_ID')
     app.config['FIREBASE_APP_ID'] = os.getenv('FIREBASE_APP_ID')
     app.config['FIREBASE_MEASUREMENT_ID'] = os.getenv('FIREBASE_MEASUREMENT_ID')
+    app.config['FIREBASE_JWKS_URL'] = os.getenv('FIREBASE_JWKS_URL', 'https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com')
     
     # Verification codes
     verification_codes_str = os.getenv('VERIFICATION_CODES', '')
@@ -44,9 +45,28 @@ def create_app():
     
     print(f"🔑 Loaded {len(app.config['VERIFICATION_CODES'])} verification codes")
     
+    # Compiled HSK corpus (see app/corpus.py)
+    app.config['CORPUS_SOURCE_DIR'] = os.getenv('CORPUS_SOURCE_DIR', os.path.join(base_dir, 'data'))
+    app.config['CORPUS_PATH'] = os.getenv('CORPUS_PATH', os.path.join(app.instance_path, 'corpus.sqlite'))
+    app.config['CORPUS_AUTO_COMPILE'] = os.getenv('CORPUS_AUTO_COMPILE', 'true').lower() == 'true'
+    corpus_levels_str = os.getenv('CORPUS_LEVELS', '')
+    app.config['CORPUS_LEVELS'] = [level.strip().upper() for level in corpus_levels_str.split(',') if level.strip()]
+    
     # Initialize extensions
     db.init_app(app)
     
+    # Background quiz pre-generation (see app/quiz_pool.py)
+    from .quiz_pool import quiz_pool
+    quiz_pool.init_app(app)
+    
+    # File-backed snapshots shared by all workers (see app/snapshot_cache.py)
+    from .snapshot_cache import snapshots
+    snapshots.init_app(app)
+    
+    # In-process rank index over User.total_score (see app/leaderboard.py)
+    from .leaderboard import leaderboard
+    leaderboard.init_app(app)
+    
     # Initialize Login Manager
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -59,26 +79,57 @@ def create_app():
     
     from .models import UserAuth, User
     
+    # Short-lived snapshots of resolved users (see app/user_cache.py)
+    from .user_cache import user_cache
+    user_cache.init_app(app)
+    
+    # Local Firebase ID token verification (see app/firebase_tokens.py)
+    from .firebase_tokens import firebase_verifier
+    firebase_verifier.init_app(app)
+    
+    # Validated login sessions, revoked across workers (see app/session_cache.py)
+    from .session_cache import session_cache
+    session_cache.init_app(app)
+    
+    # Password hashing in a bounded process pool (see app/password_hashing.py)
+    from .password_hashing import PasswordHasherBusy, in_pool_worker, password_hasher
+    password_hasher.init_app(app)
+    
+    @app.errorhandler(PasswordHasherBusy)
+    def password_hasher_busy(e):
+        """Shed auth load instead of queueing behind the password pool"""
+        response = jsonify({'success': False, 'error': 'Server busy, please try again shortly.'})
+        response.headers['Retry-After'] = '2'
+        return response, 503
+    
+    # Periodic expiry and pruning of old login sessions (see app/session_reaper.py)
+    from .session_reaper import session_reaper
+    if not in_pool_worker():
+        session_reaper.init_app(app)
+    
     @login_manager.user_loader
     def load_user(user_id):
-        """Load user from database"""
+        """Load user from the snapshot cache, falling back to the database"""
         try:
-            # Try to load from UserAuth table first (for backward compatibility)
-            user_auth = UserAuth.query.get(user_id)
-            if user_auth:
-                # Return the associated User object if it exists
-                if user_auth.user:
-                    return user_auth.user
-                # Otherwise create a User for this auth
-                return create_user_for_auth(user_auth)
-            
-            # If not found in UserAuth, try User table directly
-            user = User.query.get(user_id)
-            if user:
+            user = user_cache.get(user_id)
+            if user is not None:
                 return user
-                
-            print(f"❌ User not found with ID: {user_id}")
-            return None
+            
+            # Sessions store a User id; try it first
+            user = db.session.get(User, user_id)
+            if user is None:
+                # Older sessions stored the UserAuth id (backward compatibility)
+                user_auth = db.session.get(UserAuth, user_id)
+                if user_auth:
+                    # Return the associated User object, or create one for this auth
+                    user = user_auth.user or create_user_for_auth(user_auth)
+            
+            if user is None:
+                print(f"❌ User not found with ID: {user_id}")
+                return None
+            
+            user_cache.put(user_id, user)
+            return user
             
         except Exception as e:
             print(f"❌ Error loading user {user_id}: {str(e)}")
@@ -145,23 +196,55 @@ def create_app():
         }
         return jsonify(config)
     
-    # Create database tables
-    with app.app_context():
-        try:
-            db.create_all()
-            print("✅ Database tables created successfully")
-            
-            # Debug: Check if tables exist
-            from sqlalchemy import inspect
-            inspector = inspect(db.engine)
-            tables = inspector.get_table_names()
-            print(f"📊 Database tables: {tables}")
-            
-        except Exception as e:
-            print(f"❌ Database setup error: {e}")
-            import traceback
-            traceback.print_exc()
-    
+    @app.cli.command('compile-corpus')
+    def compile_corpus_command():
+        """Compile the HSK JSON sources into the corpus artifact"""
+        from .corpus import compile_corpus
+        compile_corpus(app.config['CORPUS_SOURCE_DIR'], app.config['CORPUS_PATH'])
+    
+    @app.cli.command('backfill-activity')
+    def backfill_activity_command():
+        """Rebuild the daily activity rollup from quiz_results"""
+        from .models import UserDailyActivity
+        users, rows = UserDailyActivity.backfill_all()
+        print(f"✅ Rebuilt {rows} daily activity rows for {users} users")
+    
+    @app.cli.command('prune-sessions')
+    def prune_sessions_command():
+        """Expire stale login sessions and delete ended ones past retention"""
+        from .session_reaper import session_reaper
+        expired, deleted = session_reaper.run_once()
+        print(f"✅ Expired {expired} sessions, deleted {deleted}")
+    
+    # Pool workers re-run this factory when they import the entry script;
+    # leave schema setup to the server process
+    if not in_pool_worker():
+        # Create database tables
+        with app.app_context():
+            try:
+                db.create_all()
+                print("✅ Database tables created successfully")
+                
+                # create_all() skips columns and indexes added to tables that already exist
+                from sqlalchemy import inspect
+                if 'quiz_token_hash' not in {column['name'] for column in inspect(db.engine).get_columns('quiz_results')}:
+                    with db.engine.begin() as connection:
+                        connection.execute(db.text('ALTER TABLE quiz_results ADD COLUMN quiz_token_hash VARCHAR(64)'))
+                
+                for table in db.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(db.engine, checkfirst=True)
+                
+                # Debug: Check if tables exist
+                inspector = inspect(db.engine)
+                tables = inspector.get_table_names()
+                print(f"📊 Database tables: {tables}")
+                
+            except Exception as e:
+                print(f"❌ Database setup error: {e}")
+                import traceback
+                traceback.print_exc()
+        
     # Add import for jsonify and uuid at the top of the function
     from flask import jsonify
     import uuid
@@ -8,33 +8,23 @@ import re
 import random
 import hashlib
 import secrets
+import time
 from sqlalchemy import or_, and_
 
 # Import db from models
 from app.models import db
+from app.firebase_tokens import firebase_verifier
+from app.session_cache import SESSION_MAX_AGE, session_cache
+from app.user_cache import user_cache
 
 auth_bp = Blueprint('auth', __name__)
 
 # ==================== HELPER FUNCTIONS ====================
 
 def verify_firebase_token(id_token):
-    """Verify Firebase ID token"""
+    """Verify Firebase ID token (locally against cached keys, see app/firebase_tokens.py)"""
     try:
-        firebase_api_key = current_app.config.get('FIREBASE_API_KEY')
-        if not firebase_api_key:
-            current_app.logger.warning("⚠️ FIREBASE_API_KEY not configured")
-            return None
-            
-        firebase_verify_url = f"https://identitytoolkit.googleapis.com/v1/accounts:lookup?key={firebase_api_key}"
-        
-        response = requests.post(firebase_verify_url, json={'idToken': id_token}, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('users'):
-                return data['users'][0]
-        current_app.logger.error(f"❌ Firebase verification failed: {response.status_code} - {response.text}")
-        return None
+        return firebase_verifier.verify(id_token)
             
     except requests.exceptions.Timeout:
         current_app.logger.error("🔥 Firebase verification timeout")
@@ -162,7 +152,10 @@ def get_device_fingerprint(request):
     return hashlib.sha256(fingerprint_str.encode()).hexdigest()
 
 def create_user_session(user_auth, request):
-    """Create a new session for user using database - WITH SESSION TOKEN"""
+    """Create a new session for user using database - WITH SESSION TOKEN
+    
+    Returns (session_token, number of old sessions revoked).
+    """
     from app.models import UserSession, generate_session_token as gen_token, get_device_fingerprint as get_fingerprint
     
     # Generate session token
@@ -170,15 +163,9 @@ def create_user_session(user_auth, request):
     device_fingerprint = get_device_fingerprint(request)
     
     # 🔥 CRITICAL: Invalidate all existing sessions FIRST (single device per user)
-    active_sessions = db.session.query(UserSession).filter_by(
-        user_auth_id=user_auth.id,
-        is_active=True
-    ).all()
-    
-    for old_session in active_sessions:
-        old_session.is_active = False
-        old_session.logout_time = datetime.utcnow()
-        current_app.logger.info(f"🔒 Invalidated old session: {old_session.session_token[:8]}")
+    revoked = UserSession.revoke_for(user_auth.id)
+    if revoked:
+        current_app.logger.info(f"🔒 Invalidated {revoked} old session(s)")
     
     # Create new session
     user_session = UserSession(
@@ -207,7 +194,7 @@ def create_user_session(user_auth, request):
     session['session_token'] = session_token
     session['user_auth_id'] = user_auth.id
     
-    return session_token
+    return session_token, revoked
 
 def validate_session():
     """Validate if the current session is still active - FROM YOUR OTHER APP"""
@@ -223,7 +210,12 @@ def validate_session():
     if not session_token or not user_auth_id:
         return False, "Invalid session data"
     
+    # Recently confirmed sessions skip the database (see app/session_cache.py)
+    if session_cache.is_active(session_token, user_auth_id):
+        return True, "Session valid"
+    
     # Check session in database
+    validated_at = time.time()
     user_session = UserSession.query.filter_by(
         session_token=session_token,
         user_auth_id=user_auth_id,
@@ -234,13 +226,14 @@ def validate_session():
         return False, "Session not found or inactive"
     
     # Check session expiration (24 hours)
-    if user_session.login_time < datetime.utcnow() - timedelta(hours=24):
+    if user_session.login_time < datetime.utcnow() - SESSION_MAX_AGE:
         # Mark as expired
         user_session.is_active = False
         user_session.logout_time = datetime.utcnow()
         db.session.commit()
         return False, "Session expired"
     
+    session_cache.remember(session_token, user_auth_id, user_session.login_time, validated_at)
     return True, "Session valid"
 
 # ==================== ROUTES ====================
@@ -302,9 +295,13 @@ def api_login():
                 current_app.logger.info(f"✅ Upgraded user to premium: {user.username}")
             
             # Create session with token (invalidates old sessions)
-            session_token = create_user_session(user_auth, request)
+            session_token, revoked = create_user_session(user_auth, request)
             
             db.session.commit()
+            if revoked:
+                # create_user_session() revoked the user's other sessions; tell every worker
+                session_cache.notify_revoked(user_auth.id)
+            user_cache.invalidate(user.id)
             login_user(user, remember=True)
             
             current_app.logger.info(f"✅ Login successful: {user.username}")
@@ -442,40 +439,32 @@ def logout_user_internal(session_token=None, user_auth_id=None):
     from app.models import UserSession
     
     # Clear session from database
+    revoked = 0
     try:
         if user_auth_id:
             # Clear ALL sessions for this user
-            user_sessions = UserSession.query.filter_by(
-                user_auth_id=user_auth_id,
-                is_active=True
-            ).all()
-            
-            for user_session in user_sessions:
-                user_session.is_active = False
-                user_session.logout_time = datetime.utcnow()
-                current_app.logger.info(f"🔒 Logged out session: {user_session.session_token[:8]}")
+            revoked = UserSession.revoke_for(user_auth_id)
+            current_app.logger.info(f"🔒 Logged out {revoked} session(s)")
         
         elif session_token and user_auth_id:
             # Clear specific session
-            user_session = UserSession.query.filter_by(
-                session_token=session_token,
-                user_auth_id=user_auth_id
-            ).first()
-            
-            if user_session:
-                user_session.is_active = False
-                user_session.logout_time = datetime.utcnow()
+            revoked = UserSession.revoke_for(user_auth_id, session_token=session_token)
+            if revoked:
                 current_app.logger.info(f"🔒 Logged out session: {session_token[:8]}")
     
     except Exception as e:
         current_app.logger.error(f"❌ Error clearing sessions: {str(e)}")
     
     # Clear Flask session
+    if current_user.is_authenticated:
+        user_cache.invalidate(current_user.id)
     session.clear()
     logout_user()
     
     try:
         db.session.commit()
+        if revoked:
+            session_cache.notify_revoked(user_auth_id)
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"❌ Database commit error during logout: {str(e)}")
@@ -0,0 +1,394 @@
+"""
+HSK corpus compiler and lazy loader.
+
+The vocabulary and sentence banks live as editable JSON sources in
+``data/hsk<N>_words.json`` / ``data/hsk<N>_sentences.json``. They are compiled
+into a single versioned SQLite artifact which the blueprints open lazily the
+first time a kind of item is needed.
+
+Each worker process loads every item of a kind into memory on first use,
+rather than reading items from the artifact on demand. Quiz sampling, the
+seen-item filter, the search index and the distractor engine all iterate the
+whole item list, so lazy per-item reads would not save memory and would add a
+query to every request. The cost is one copy per worker: about 1 MB for the
+~1,000 HSK 1 items. Set CORPUS_LEVELS to load only some levels if the banks
+grow enough for that to matter.
+"""
+from collections import namedtuple
+from datetime import datetime
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from flask import current_app
+
+# Bump whenever the artifact schema changes so stale artifacts get rebuilt
+FORMAT_VERSION = 2
+
+# Options are stored as a single column joined with the ASCII unit separator
+OPTION_SEPARATOR = '\x1f'
+
+KINDS = ('words', 'sentences')
+
+# Name of the Chinese text field in the JSON sources / API payloads
+HANZI_FIELDS = {
+    'words': 'word',
+    'sentences': 'sentence'
+}
+
+SOURCE_PATTERN = re.compile(r'^(hsk\d+)_(words|sentences)\.json$')
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE items (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    hanzi TEXT NOT NULL,
+    pinyin TEXT NOT NULL,
+    english TEXT NOT NULL,
+    options TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (kind, id)
+) WITHOUT ROWID;
+CREATE INDEX idx_items_kind_level ON items (kind, level);
+"""
+
+
+class CorpusItem(namedtuple('CorpusItem', 'kind id level hanzi pinyin english options correct')):
+    """Immutable word or sentence from the compiled corpus"""
+    __slots__ = ()
+
+    def to_dict(self):
+        """Convert item to the JSON shape used by the quiz APIs"""
+        return {
+            'id': self.id,
+            HANZI_FIELDS[self.kind]: self.hanzi,
+            'pinyin': self.pinyin,
+            'english': self.english,
+            'options': list(self.options),
+            'correctAnswer': self.correct,
+            'level': self.level
+        }
+
+
+class CorpusValidationError(ValueError):
+    """Raised for a source entry that cannot be compiled into a quiz item"""
+
+
+class Corpus:
+    """All items of one kind loaded from the compiled artifact"""
+
+    def __init__(self, kind, version, items, report=None):
+        self.kind = kind
+        self.version = version
+        self.items = tuple(items)
+        # Build-time validation issues for this kind, keyed by item id
+        self.report = tuple(report or ())
+        self.issues_by_id = {issue['id']: issue for issue in self.report if issue['id'] is not None}
+        # id -> item index shared by detail and batch lookups
+        self.by_id = {item.id: item for item in self.items}
+
+    def get(self, item_id):
+        """Return the item with the given id, or None"""
+        return self.by_id.get(item_id)
+
+    def get_many(self, item_ids):
+        """Return (items, missing_ids) for a list of ids, keeping the requested order"""
+        items = []
+        missing = []
+        for item_id in item_ids:
+            item = self.by_id.get(item_id)
+            if item is None:
+                missing.append(item_id)
+            else:
+                items.append(item)
+        return items, missing
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+# Upper bound on ids accepted by the batch item endpoints
+MAX_BATCH_IDS = 200
+
+
+def parse_item_ids(raw_ids):
+    """Parse a comma-separated id list such as '1,5,42' into unique ints.
+
+    Raises ValueError for non-numeric ids or more than MAX_BATCH_IDS ids.
+    """
+    item_ids = []
+    seen = set()
+    for part in (raw_ids or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        item_id = int(part)
+        if item_id not in seen:
+            seen.add(item_id)
+            item_ids.append(item_id)
+
+    if len(item_ids) > MAX_BATCH_IDS:
+        raise ValueError(f'At most {MAX_BATCH_IDS} ids per request')
+    return item_ids
+
+
+# ==================== VALIDATION ====================
+
+_QUOTE_TRANSLATION = str.maketrans({'\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"'})
+
+
+def normalize_answer(text):
+    """Normalize option text for answer-key matching (case, quotes, punctuation, spacing)"""
+    text = text.translate(_QUOTE_TRANSLATION).lower()
+    text = re.sub(r'[^\w\s]', '', text)
+    return ' '.join(text.split())
+
+
+def parse_source_id(entry):
+    """Return the entry's id as a non-negative int, or raise CorpusValidationError"""
+    item_id = entry.get('id')
+    if isinstance(item_id, str) and item_id.strip().isdigit():
+        item_id = int(item_id)
+    if not isinstance(item_id, int) or isinstance(item_id, bool) or item_id < 0:
+        raise CorpusValidationError(f'Invalid id: {item_id!r}')
+    return item_id
+
+
+def resolve_answer_key(entry, hanzi_field):
+    """Validate a source entry and return (correct_index, (status, message) or None).
+
+    The 'english' field is the canonical answer. If exactly one option matches it
+    that option wins, even when it disagrees with the declared correctAnswer. If no
+    option matches, the declared index is kept and reported as unverified.
+    Raises CorpusValidationError for entries that cannot be served.
+    """
+    for field in (hanzi_field, 'english', 'options'):
+        if not entry.get(field):
+            raise CorpusValidationError(f'Missing {field}')
+
+    options = entry['options']
+    if len(options) < 2 or not all(isinstance(option, str) and option.strip() for option in options):
+        raise CorpusValidationError('Needs at least two non-empty options')
+    if any(OPTION_SEPARATOR in option for option in options):
+        raise CorpusValidationError('Option contains the option separator character')
+
+    normalized = [normalize_answer(option) for option in options]
+    if len(set(normalized)) != len(normalized):
+        raise CorpusValidationError('Duplicate options')
+
+    declared = entry.get('correctAnswer')
+    declared_valid = isinstance(declared, int) and 0 <= declared < len(options)
+
+    english = normalize_answer(entry['english'])
+    if english in normalized:
+        resolved = normalized.index(english)
+        if resolved != declared:
+            return resolved, ('corrected', f'correctAnswer {declared} corrected to {resolved} to match english field')
+        return resolved, None
+
+    if declared_valid:
+        return declared, ('unverified', 'english field does not match any option; using correctAnswer')
+
+    raise CorpusValidationError(f'Invalid correctAnswer index: {declared}')
+
+
+# ==================== COMPILER ====================
+
+def find_sources(source_dir):
+    """Return sorted (level, kind, path) tuples for every corpus source file"""
+    sources = []
+    for path in glob.glob(os.path.join(source_dir, 'hsk*_*.json')):
+        match = SOURCE_PATTERN.match(os.path.basename(path))
+        if match:
+            sources.append((match.group(1).upper(), match.group(2), path))
+    return sorted(sources)
+
+
+def compile_corpus(source_dir, artifact_path):
+    """Compile the JSON sources into a SQLite artifact and return its version"""
+    sources = find_sources(source_dir)
+    if not sources:
+        raise FileNotFoundError(f'No corpus sources found in {source_dir}')
+
+    digest = hashlib.sha256()
+    rows = []
+    counts = {}
+    report = []
+    seen = set()
+
+    for level, kind, path in sources:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest.update(os.path.basename(path).encode())
+        digest.update(raw)
+
+        hanzi_field = HANZI_FIELDS[kind]
+        for entry in json.loads(raw.decode('utf-8')):
+            if not isinstance(entry, dict):
+                report.append({'kind': kind, 'id': None, 'level': level, 'status': 'rejected',
+                               'issue': 'Entry is not an object'})
+                continue
+
+            issue = {
+                'kind': kind,
+                'id': None,
+                'level': level,
+                'english_field': entry.get('english'),
+                'declared_correct': entry.get('correctAnswer'),
+                'options': entry.get('options')
+            }
+
+            try:
+                item_id = issue['id'] = parse_source_id(entry)
+                if (kind, item_id) in seen:
+                    raise CorpusValidationError('Duplicate id')
+                correct, warning = resolve_answer_key(entry, hanzi_field)
+            except CorpusValidationError as e:
+                report.append(dict(issue, status='rejected', issue=str(e)))
+                continue
+
+            seen.add((kind, item_id))
+            if warning:
+                status, message = warning
+                report.append(dict(issue, status=status, issue=message, resolved_correct=correct))
+
+            rows.append((
+                kind,
+                item_id,
+                level,
+                entry[hanzi_field],
+                entry.get('pinyin', ''),
+                entry['english'],
+                OPTION_SEPARATOR.join(entry['options']),
+                correct
+            ))
+            counts[kind] = counts.get(kind, 0) + 1
+
+    version = f"{FORMAT_VERSION}-{digest.hexdigest()[:12]}"
+
+    os.makedirs(os.path.dirname(os.path.abspath(artifact_path)), exist_ok=True)
+    tmp_path = f"{artifact_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany('INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('format_version', str(FORMAT_VERSION)),
+            ('corpus_version', version),
+            ('built_at', datetime.utcnow().isoformat()),
+            ('counts', json.dumps(counts)),
+            ('validation_report', json.dumps(report, ensure_ascii=False))
+        ])
+        conn.commit()
+    finally:
+        conn.close()
+
+    # Atomic swap so running workers never see a half-written artifact
+    os.replace(tmp_path, artifact_path)
+    print(f"📦 Compiled corpus {version}: {counts} -> {artifact_path}")
+
+    for issue in report:
+        icon = '❌' if issue['status'] == 'rejected' else '⚠️'
+        print(f"   {icon} {issue['kind']} {issue['id']}: {issue['issue']}")
+
+    return version
+
+
+def artifact_is_stale(source_dir, artifact_path):
+    """Check whether the artifact is missing or older than any of its sources"""
+    if not os.path.exists(artifact_path):
+        return True
+
+    built_at = os.path.getmtime(artifact_path)
+    if any(os.path.getmtime(path) > built_at for _, _, path in find_sources(source_dir)):
+        return True
+
+    try:
+        conn = sqlite3.connect(f"file:{artifact_path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return True
+
+    return row is None or row[0] != str(FORMAT_VERSION)
+
+
+# ==================== LAZY LOADER ====================
+
+_corpora = {}
+_lock = threading.Lock()
+
+
+def _read_corpus(artifact_path, kind, levels):
+    """Read one kind of item from the artifact"""
+    conn = sqlite3.connect(f"file:{artifact_path}?mode=ro", uri=True)
+    try:
+        version = conn.execute("SELECT value FROM meta WHERE key = 'corpus_version'").fetchone()[0]
+        report_json = conn.execute("SELECT value FROM meta WHERE key = 'validation_report'").fetchone()[0]
+        report = [issue for issue in json.loads(report_json) if issue['kind'] == kind]
+
+        query = 'SELECT id, level, hanzi, pinyin, english, options, correct FROM items WHERE kind = ?'
+        params = [kind]
+        if levels:
+            query += f" AND level IN ({', '.join('?' for _ in levels)})"
+            params.extend(levels)
+        query += ' ORDER BY id'
+
+        items = [
+            CorpusItem(kind, item_id, level, hanzi, pinyin, english,
+                       tuple(options.split(OPTION_SEPARATOR)), correct)
+            for item_id, level, hanzi, pinyin, english, options, correct in conn.execute(query, params)
+        ]
+    finally:
+        conn.close()
+
+    return Corpus(kind, version, items, report)
+
+
+def get_corpus(kind):
+    """Return the loaded corpus for 'words' or 'sentences', compiling it on first use"""
+    if kind not in KINDS:
+        raise ValueError(f'Unknown corpus kind: {kind}')
+
+    artifact_path = current_app.config['CORPUS_PATH']
+    key = (artifact_path, kind)
+
+    corpus = _corpora.get(key)
+    if corpus is not None:
+        return corpus
+
+    with _lock:
+        corpus = _corpora.get(key)
+        if corpus is None:
+            source_dir = current_app.config['CORPUS_SOURCE_DIR']
+            if current_app.config.get('CORPUS_AUTO_COMPILE', True) and artifact_is_stale(source_dir, artifact_path):
+                compile_corpus(source_dir, artifact_path)
+
+            corpus = _read_corpus(artifact_path, kind, current_app.config.get('CORPUS_LEVELS'))
+            _corpora[key] = corpus
+            print(f"📚 Loaded {len(corpus)} {kind} from corpus {corpus.version}")
+
+    return corpus
+
+
+def reset_corpus_cache():
+    """Drop loaded corpora so the next access re-reads the artifact"""
+    with _lock:
+        _corpora.clear()
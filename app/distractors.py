@@ -0,0 +1,160 @@
+"""
+Corpus-driven distractor generation.
+
+Instead of the four hand-typed options, wrong answers can be drawn from the
+answers of other items in the same corpus. Items are compared on three
+features, each a TF-IDF weighted, L2-normalized term matrix built with the
+search analyzers:
+- English gloss tokens
+- shared hanzi characters/bigrams
+- toneless pinyin syllables
+
+Their cosine similarities are blended into one item x item matrix, and each
+item keeps its CANDIDATES most similar answers. Drawing distractors for a whole
+quiz is then a single vectorized Gumbel-top-k over a (questions x CANDIDATES)
+array, so every item has many possible distractor sets and plausible ones are
+favoured.
+"""
+import threading
+
+import numpy as np
+
+from .search_index import english_terms, hanzi_terms, pinyin_terms
+
+# Query value for ?distractors= that enables this engine
+DISTRACTOR_MODES = ('corpus',)
+
+# Blend weights for the three similarity features
+FEATURE_WEIGHTS = {'english': 0.5, 'hanzi': 0.3, 'pinyin': 0.2}
+
+# Candidates kept per item; C(24, 3) = 2024 possible distractor sets
+CANDIDATES = 24
+
+# Wrong options per question (plus the correct answer = 4 options)
+DISTRACTOR_COUNT = 3
+
+# Gloss similarity above which a candidate is treated as a synonym and masked
+SYNONYM_THRESHOLD = 0.95
+
+# Softmax temperature for sampling among candidates (lower = more similar)
+TEMPERATURE = 0.15
+
+
+def _feature_matrix(documents):
+    """Return an L2-normalized TF-IDF matrix (n_items x n_terms) for lists of terms"""
+    vocabulary = {}
+    rows, cols = [], []
+    for row, terms in enumerate(documents):
+        for term in set(terms):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+
+    matrix = np.zeros((len(documents), max(len(vocabulary), 1)), dtype=np.float32)
+    matrix[rows, cols] = 1.0
+
+    document_frequency = matrix.sum(axis=0)
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1.0
+    matrix *= idf.astype(np.float32)
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class DistractorEngine:
+    """Precomputed similarity neighbourhoods for one corpus"""
+
+    def __init__(self, corpus):
+        self.version = corpus.version
+        self.items = corpus.items
+        self.positions = {item.id: position for position, item in enumerate(self.items)}
+        self.answers = tuple(item.options[item.correct] for item in self.items)
+
+        english = _feature_matrix([english_terms(answer) for answer in self.answers])
+        hanzi = _feature_matrix([hanzi_terms(item.hanzi) for item in self.items])
+        pinyin = _feature_matrix([pinyin_terms(item.pinyin) for item in self.items])
+
+        english_similarity = english @ english.T
+        similarity = (FEATURE_WEIGHTS['english'] * english_similarity
+                      + FEATURE_WEIGHTS['hanzi'] * (hanzi @ hanzi.T)
+                      + FEATURE_WEIGHTS['pinyin'] * (pinyin @ pinyin.T))
+
+        # Never offer the item itself, a synonym, or a repeat of the same answer text
+        normalized = np.array([answer.strip().lower() for answer in self.answers])
+        _, first_occurrence = np.unique(normalized, return_index=True)
+        is_first = np.zeros(len(self.items), dtype=bool)
+        is_first[first_occurrence] = True
+
+        mask = (normalized[:, None] == normalized[None, :]) | (english_similarity >= SYNONYM_THRESHOLD)
+        mask |= ~is_first[None, :]
+        np.fill_diagonal(mask, True)
+        similarity[mask] = -np.inf
+
+        k = min(CANDIDATES, max(len(self.items) - 1, 1))
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarity, top, axis=1)
+
+        self.candidates = top
+        # Masked slots (tiny corpora) get -inf so they are never drawn
+        self.logits = np.where(np.isfinite(top_scores), top_scores / TEMPERATURE, -np.inf)
+
+    def draw(self, items, rng):
+        """Return a (len(items) x DISTRACTOR_COUNT) array of distractor positions.
+
+        Slots an item has no valid candidate for (synonyms and duplicates masked
+        out, or a tiny corpus) are -1.
+        """
+        rows = np.fromiter((self.positions[item.id] for item in items), dtype=np.intp, count=len(items))
+        drawn = np.full((rows.size, DISTRACTOR_COUNT), -1, dtype=np.intp)
+        k = min(DISTRACTOR_COUNT, self.logits.shape[1])
+        if rows.size == 0:
+            return drawn
+
+        # Gumbel-top-k: k samples without replacement, weighted by softmax(logits)
+        noise = rng.gumbel(size=(rows.size, self.logits.shape[1]))
+        keys = self.logits[rows] + noise
+        picks = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+        # -inf keys are masked candidates; they only come up when a row has fewer than k valid ones
+        valid = np.isfinite(np.take_along_axis(keys, picks, axis=1))
+        drawn[:, :k] = np.where(valid, np.take_along_axis(self.candidates[rows], picks, axis=1), -1)
+        return drawn
+
+    def with_distractors(self, items, rng):
+        """Return copies of `items` whose options are the answer plus drawn distractors.
+
+        `rng` is the quiz's random.Random; the NumPy generator is seeded from it so
+        the draw is reproducible from the quiz seed. Missing slots are filled from
+        the item's stored wrong options.
+        """
+        drawn = self.draw(items, np.random.default_rng(rng.getrandbits(64)))
+        quiz_items = []
+        for item, row in zip(items, drawn.tolist()):
+            answer = item.options[item.correct]
+            options = [answer] + [self.answers[p] for p in row if p >= 0]
+            if len(options) <= DISTRACTOR_COUNT:
+                taken = {option.strip().lower() for option in options}
+                for option in item.options:
+                    if len(options) > DISTRACTOR_COUNT:
+                        break
+                    if option.strip().lower() not in taken:
+                        taken.add(option.strip().lower())
+                        options.append(option)
+            quiz_items.append(item._replace(options=tuple(options), correct=0))
+        return quiz_items
+
+
+_engines = {}
+_lock = threading.Lock()
+
+
+def get_distractor_engine(corpus):
+    """Return the distractor engine for a loaded corpus, rebuilding it when its version changes"""
+    engine = _engines.get(corpus.kind)
+    if engine is not None and engine.version == corpus.version:
+        return engine
+
+    with _lock:
+        engine = _engines.get(corpus.kind)
+        if engine is None or engine.version != corpus.version:
+            engine = DistractorEngine(corpus)
+            _engines[corpus.kind] = engine
+    return engine
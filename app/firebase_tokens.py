@@ -0,0 +1,217 @@
+"""
+Local verification of Firebase ID tokens.
+
+Firebase ID tokens are RS256 JWTs signed with Google's rotating keys. Instead of
+a blocking accounts:lookup round trip per login, tokens are checked locally
+against the published JWKS (FIREBASE_JWKS_URL):
+- keys are cached for the max-age in the endpoint's Cache-Control header
+- shortly before they expire, a background thread refetches them while the
+  current set keeps serving
+- an unknown kid triggers one rate-limited synchronous refetch (key rotation)
+
+Claims are mapped to the accounts:lookup shape the auth routes already use
+(localId, email, emailVerified).
+
+PyJWT (with the crypto extra) is optional. Without it, or without
+FIREBASE_PROJECT_ID, or while the keys can't be fetched, verification falls
+back to the remote lookup over a pooled requests.Session when
+FIREBASE_REMOTE_VERIFY is enabled. A token that fails local checks is rejected
+outright and never retried remotely.
+"""
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import jwt
+except ImportError:  # PyJWT is optional; without it tokens are verified remotely
+    jwt = None
+
+DEFAULT_JWKS_URL = 'https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com'
+
+LOOKUP_URL = 'https://identitytoolkit.googleapis.com/v1/accounts:lookup?key={api_key}'
+
+# Key lifetime when the endpoint sends no usable max-age
+DEFAULT_KEY_MAX_AGE = 3600
+
+# Start a background refresh this many seconds before the keys expire
+REFRESH_MARGIN = 300
+
+# Minimum seconds between refetches forced by an unknown kid
+MIN_FORCED_REFRESH_INTERVAL = 30
+
+# Allowed clock difference for exp/iat/auth_time checks
+CLOCK_SKEW = 60
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+class TokenVerificationError(ValueError):
+    """Raised when an ID token fails local verification"""
+
+
+def _pooled_session(pool_size=10):
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    http.mount('https://', adapter)
+    http.mount('http://', adapter)
+    return http
+
+
+class FirebaseTokenVerifier:
+    """Verify Firebase ID tokens against cached signing keys, with remote fallback"""
+
+    def __init__(self):
+        self.project_id = None
+        self.api_key = None
+        self.jwks_url = DEFAULT_JWKS_URL
+        self.remote_fallback = True
+        self.timeout = 10
+        self.http = _pooled_session()
+        self._keys = {}
+        self._expires_at = 0.0
+        self._forced_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.project_id = app.config.get('FIREBASE_PROJECT_ID')
+        self.api_key = app.config.get('FIREBASE_API_KEY')
+        self.jwks_url = app.config.setdefault('FIREBASE_JWKS_URL', DEFAULT_JWKS_URL)
+        self.remote_fallback = app.config.setdefault('FIREBASE_REMOTE_VERIFY', True)
+        self.timeout = app.config.setdefault('FIREBASE_HTTP_TIMEOUT', 10)
+
+    @property
+    def local_enabled(self):
+        return jwt is not None and bool(self.project_id)
+
+    # ---------- signing keys ----------
+
+    def _fetch_keys(self):
+        """Download the JWKS; returns ({kid: key}, max_age)"""
+        response = self.http.get(self.jwks_url, timeout=self.timeout)
+        response.raise_for_status()
+
+        document = response.json()  # ValueError when the body isn't JSON
+        if not isinstance(document, dict) or not isinstance(document.get('keys', []), list):
+            raise ValueError('JWKS response has no keys list')
+
+        keys = {}
+        for jwk in document.get('keys', []):
+            try:
+                keys[jwk['kid']] = jwt.PyJWK(jwk).key
+            except (KeyError, TypeError, jwt.PyJWTError):
+                continue
+
+        match = _MAX_AGE.search(response.headers.get('Cache-Control', ''))
+        return keys, int(match.group(1)) if match else DEFAULT_KEY_MAX_AGE
+
+    def _store(self, keys, max_age):
+        with self._lock:
+            self._keys = keys
+            self._expires_at = time.monotonic() + max_age
+
+    def _refresh_in_background(self):
+        try:
+            self._store(*self._fetch_keys())
+        except Exception as e:
+            print(f"❌ Firebase key refresh error: {str(e)}")
+        finally:
+            self._refreshing = False
+
+    def _get_key(self, kid):
+        """Return the public key for a kid, fetching or refreshing the key set as needed"""
+        now = time.monotonic()
+        if now >= self._expires_at:
+            # No usable key set: this request has to wait for it
+            self._store(*self._fetch_keys())
+        elif now >= self._expires_at - REFRESH_MARGIN and not self._refreshing:
+            with self._lock:
+                start = not self._refreshing
+                self._refreshing = True
+            if start:
+                threading.Thread(target=self._refresh_in_background, name='firebase-keys', daemon=True).start()
+
+        key = self._keys.get(kid)
+        if key is None and now - self._forced_at >= MIN_FORCED_REFRESH_INTERVAL:
+            # Possibly a key rotated in since the last fetch
+            self._forced_at = now
+            self._store(*self._fetch_keys())
+            key = self._keys.get(kid)
+        return key
+
+    # ---------- verification ----------
+
+    def verify_locally(self, id_token):
+        """Check signature and claims; returns the lookup-shaped user dict or raises TokenVerificationError"""
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError as e:
+            raise TokenVerificationError(f'Malformed token: {e}')
+        if header.get('alg') != 'RS256':
+            raise TokenVerificationError('Unexpected signing algorithm')
+
+        key = self._get_key(header.get('kid'))
+        if key is None:
+            raise TokenVerificationError('Unknown signing key')
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=['RS256'],
+                audience=self.project_id,
+                issuer=f'https://securetoken.google.com/{self.project_id}',
+                leeway=CLOCK_SKEW,
+                options={'require': ['exp', 'iat', 'aud', 'iss', 'sub']}
+            )
+        except jwt.PyJWTError as e:
+            raise TokenVerificationError(str(e))
+
+        if not claims['sub'] or len(claims['sub']) > 128:
+            raise TokenVerificationError('Invalid subject')
+        if claims.get('auth_time', 0) > time.time() + CLOCK_SKEW:
+            raise TokenVerificationError('auth_time is in the future')
+
+        return {
+            'localId': claims['sub'],
+            'email': claims.get('email', ''),
+            'emailVerified': bool(claims.get('email_verified', False))
+        }
+
+    def verify_remotely(self, id_token):
+        """Look the token up with the Identity Toolkit API; returns the user dict or None"""
+        if not self.api_key:
+            print("⚠️ FIREBASE_API_KEY not configured")
+            return None
+
+        response = self.http.post(LOOKUP_URL.format(api_key=self.api_key),
+                                  json={'idToken': id_token}, timeout=self.timeout)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('users'):
+                return data['users'][0]
+        print(f"❌ Firebase verification failed: {response.status_code} - {response.text}")
+        return None
+
+    def verify(self, id_token):
+        """Return the Firebase user for a valid ID token, or None"""
+        if self.local_enabled:
+            try:
+                return self.verify_locally(id_token)
+            except TokenVerificationError as e:
+                print(f"❌ Firebase token rejected: {str(e)}")
+                return None
+            except (requests.RequestException, ValueError) as e:
+                # Keys unavailable or malformed; the remote lookup can still answer
+                print(f"⚠️ Firebase signing keys unavailable: {str(e)}")
+
+        if not self.remote_fallback:
+            return None
+        return self.verify_remotely(id_token)
+
+
+firebase_verifier = FirebaseTokenVerifier()
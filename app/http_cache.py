@@ -0,0 +1,109 @@
+"""
+Pre-serialized, precompressed JSON responses with strong ETags.
+
+Payloads that only change when their source changes (the corpus catalog, for
+example) are encoded to JSON once, compressed once with gzip and brotli, and
+then served as raw bytes. Clients that send a matching If-None-Match get a 304.
+"""
+import gzip
+import hashlib
+import json
+import threading
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+class PrecompressedPayload:
+    """One JSON document held as identity, gzip and (optionally) brotli bytes"""
+
+    def __init__(self, body, mimetype='application/json'):
+        self.mimetype = mimetype
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.encodings = {
+            'identity': body,
+            'gzip': gzip.compress(body, compresslevel=9, mtime=0)
+        }
+        if brotli is not None:
+            self.encodings['br'] = brotli.compress(body, quality=11)
+
+    def etag_for(self, encoding):
+        """Strong ETag for one encoded representation"""
+        return self.etag if encoding == 'identity' else f'{self.etag}-{encoding}'
+
+    def matches(self, if_none_match):
+        """Check If-None-Match against any representation of this payload"""
+        return any(if_none_match.contains(self.etag_for(encoding)) for encoding in self.encodings)
+
+
+def json_payload(data):
+    """Serialize data once into a PrecompressedPayload"""
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return PrecompressedPayload(body)
+
+
+def choose_encoding(payload):
+    """Pick the best encoding the client accepts"""
+    accepted = request.accept_encodings
+    for encoding in ('br', 'gzip'):
+        if encoding in payload.encodings and accepted[encoding]:
+            return encoding
+    return 'identity'
+
+
+def send_payload(payload, cache_control='no-cache'):
+    """Serve a PrecompressedPayload, answering 304 when the client copy is current"""
+    encoding = choose_encoding(payload)
+    etag = payload.etag_for(encoding)
+
+    if payload.matches(request.if_none_match):
+        response = Response(status=304)
+    else:
+        response = Response(payload.encodings[encoding], mimetype=payload.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+class PayloadCache:
+    """Build each named payload once per source version"""
+
+    def __init__(self):
+        self._payloads = {}
+        self._lock = threading.Lock()
+
+    def get(self, name, version, builder):
+        """Return the cached payload for (name, version), building it with builder() on a miss"""
+        entry = self._payloads.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            entry = self._payloads.get(name)
+            if entry is None or entry[0] != version:
+                entry = (version, json_payload(builder()))
+                self._payloads[name] = entry
+        return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._payloads.clear()
+
+
+# Shared cache for catalog payloads keyed by corpus version
+catalog_payloads = PayloadCache()
+
+
+def raw_json_response(body, status=200):
+    """Wrap already-serialized JSON bytes in a response without re-encoding"""
+    response = Response(body, status=status, mimetype='application/json')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
@@ -0,0 +1,466 @@
+"""
+In-process order-statistic index over users' all-time scores.
+
+Users are kept in an indexable skip list ordered by (-total_score, user_id), so
+rank lookups, top-N and "users around me" are O(log n) instead of sorting the
+user table per request. The index is seeded from the database, updated in place
+when this process saves a score, and reseeded in the background every
+LEADERBOARD_TTL seconds to pick up writes made by other worker processes. It
+serves per-process rank and around-me lookups; the all-time top list shared
+by all workers is read from the database instead.
+
+Time-windowed boards (daily, weekly, monthly) sum UserDailyActivity scores
+since the start of the current UTC calendar window. They are loaded with one
+GROUP BY, bumped in place as this process saves quizzes, and published as
+precompressed, ETag'd snapshots rebuilt at most every SNAPSHOT_INTERVAL seconds.
+"""
+from datetime import datetime, timedelta
+import heapq
+import random
+import threading
+import time
+
+from flask import current_app
+
+from .http_cache import PayloadCache
+from .models import db, User, UserDailyActivity
+from .snapshot_cache import snapshots
+
+# Size of the all-time top list served from the shared snapshot
+TOP_N = 50
+
+# Snapshot cache name for the all-time top list
+TOP_SNAPSHOT = 'leaderboard-top'
+
+
+class IndexableSkipList:
+    """Sorted distinct keys with O(log n) insert, remove, rank and select-by-rank.
+
+    Every forward link also stores its width (how many bottom-level steps it
+    skips), which is what makes positional lookups logarithmic.
+    """
+
+    MAX_LEVEL = 24  # comfortably above log2 of the user count
+
+    class _Node:
+        __slots__ = ('key', 'next', 'width')
+
+        def __init__(self, key, height):
+            self.key = key
+            self.next = [None] * height
+            self.width = [1] * height
+
+    def __init__(self):
+        self.head = self._Node(None, self.MAX_LEVEL)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """Build from already-sorted distinct keys in O(n)"""
+        skiplist = cls()
+        last = [skiplist.head] * cls.MAX_LEVEL
+        last_position = [0] * cls.MAX_LEVEL
+        position = 0
+        for position, key in enumerate(keys, start=1):
+            node = cls._Node(key, skiplist._random_height())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+        # Widths of the final links reach the implicit end at position size + 1
+        for level in range(cls.MAX_LEVEL):
+            last[level].width[level] = position + 1 - last_position[level]
+        skiplist.size = position
+        return skiplist
+
+    def _random_height(self):
+        height = 1
+        while height < self.MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        return height
+
+    def _find_chain(self, key):
+        """Return (last node before key at each level, steps taken at each level)"""
+        chain = [None] * self.MAX_LEVEL
+        steps = [0] * self.MAX_LEVEL
+        node = self.head
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        return chain, steps
+
+    def insert(self, key):
+        chain, steps = self._find_chain(key)
+        height = self._random_height()
+        node = self._Node(key, height)
+
+        distance = 0  # bottom-level steps from chain[level] to the new node's predecessor
+        for level in range(height):
+            previous = chain[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            node.width[level] = previous.width[level] - distance
+            previous.width[level] = distance + 1
+            distance += steps[level]
+        for level in range(height, self.MAX_LEVEL):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain, _ = self._find_chain(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        for level in range(len(node.next)):
+            previous = chain[level]
+            previous.width[level] += node.width[level] - 1
+            previous.next[level] = node.next[level]
+        for level in range(len(node.next), self.MAX_LEVEL):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def index(self, key):
+        """0-based position of key; raises KeyError when absent"""
+        chain, steps = self._find_chain(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return sum(steps)
+
+    def slice(self, start, count):
+        """Return up to `count` keys starting at 0-based position `start`"""
+        if start >= self.size or count <= 0:
+            return []
+
+        node = self.head
+        remaining = start + 1
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        keys = []
+        while node is not None and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class Leaderboard:
+    """Rank index over User.total_score for this process"""
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._index = IndexableSkipList()
+        self._scores = {}
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._reseeding = False
+        self._pending = None
+
+    def init_app(self, app):
+        self.ttl = app.config.setdefault('LEADERBOARD_TTL', 300)
+        for board in windowed_leaderboards.values():
+            board.ttl = self.ttl
+
+    @staticmethod
+    def _key(user_id, score):
+        return (-(score or 0), user_id)
+
+    def _load_scores(self):
+        return {user_id: score or 0 for user_id, score in
+                db.session.query(User.id, User.total_score).execution_options(yield_per=10000)}
+
+    def _build(self, scores):
+        return IndexableSkipList.from_sorted(sorted(self._key(user_id, score) for user_id, score in scores.items()))
+
+    def _reseed(self, app):
+        """Rebuild off the lock, then replay updates that arrived meanwhile"""
+        try:
+            with app.app_context():
+                scores = self._load_scores()
+                db.session.remove()
+            index = self._build(scores)
+            with self._lock:
+                pending, self._pending = self._pending or {}, None
+                for user_id, score in pending.items():
+                    if user_id in scores:
+                        index.remove(self._key(user_id, scores[user_id]))
+                    if score is None:
+                        scores.pop(user_id, None)
+                    else:
+                        scores[user_id] = score
+                        index.insert(self._key(user_id, score))
+                self._index, self._scores = index, scores
+                self._loaded_at = time.monotonic()
+        except Exception as e:
+            print(f"❌ Leaderboard reseed error: {str(e)}")
+            with self._lock:
+                self._pending = None
+                self._loaded_at = time.monotonic()  # keep serving the old index; retry after the TTL
+        finally:
+            self._reseeding = False
+
+    def ensure_fresh(self):
+        """Seed on first use; afterwards reseed in the background once the TTL has passed"""
+        if self._loaded_at is None:
+            with self._lock:
+                if self._loaded_at is None:
+                    scores = self._load_scores()
+                    self._index, self._scores = self._build(scores), scores
+                    self._loaded_at = time.monotonic()
+            return
+
+        if time.monotonic() - self._loaded_at > self.ttl and not self._reseeding:
+            with self._lock:
+                if self._reseeding:
+                    return
+                self._reseeding = True
+                self._pending = {}
+            app = current_app._get_current_object()
+            threading.Thread(target=self._reseed, args=(app,), name='leaderboard-reseed', daemon=True).start()
+
+    def update(self, user_id, score):
+        """Move a user to a new score (None removes them).
+
+        Returns True when the user was or now is in the top TOP_N, i.e. when
+        the shared top snapshot is out of date.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending[user_id] = score
+            if self._loaded_at is None:
+                return True
+            touched = False
+            old = self._scores.pop(user_id, None)
+            if old is not None:
+                touched = self._index.index(self._key(user_id, old)) < TOP_N
+                self._index.remove(self._key(user_id, old))
+            if score is not None:
+                self._scores[user_id] = score
+                self._index.insert(self._key(user_id, score))
+                touched = touched or self._index.index(self._key(user_id, score)) < TOP_N
+            return touched
+
+    def remove(self, user_id):
+        return self.update(user_id, None)
+
+    def rank(self, user_id):
+        """1-based rank of a user, or None if they don't exist"""
+        self.ensure_fresh()
+        with self._lock:
+            score = self._scores.get(user_id)
+            if score is not None:
+                return self._index.index(self._key(user_id, score)) + 1
+
+        # Not indexed yet (e.g. registered since the last reseed)
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        self.update(user_id, user.total_score or 0)
+        with self._lock:
+            return self._index.index(self._key(user_id, user.total_score or 0)) + 1
+
+    def top(self, count, start=0):
+        """Return [(rank, user_id, score)] for `count` users from 0-based position `start`"""
+        self.ensure_fresh()
+        with self._lock:
+            keys = self._index.slice(start, count)
+        return [(start + offset + 1, user_id, -negative_score)
+                for offset, (negative_score, user_id) in enumerate(keys)]
+
+    def around(self, user_id, radius):
+        """Return (rank, [(rank, user_id, score)]) for up to `radius` users either side of a user"""
+        rank = self.rank(user_id)
+        if rank is None:
+            return None, []
+        with self._lock:
+            # Re-read under the lock; a concurrent update may have moved the user
+            score = self._scores.get(user_id, 0)
+            position = self._index.index(self._key(user_id, score))
+            start = max(position - radius, 0)
+            keys = self._index.slice(start, position - start + radius + 1)
+        return position + 1, [(start + offset + 1, entry_id, -negative_score)
+                              for offset, (negative_score, entry_id) in enumerate(keys)]
+
+    def __len__(self):
+        return len(self._index)
+
+
+leaderboard = Leaderboard()
+
+
+def build_top_snapshot():
+    """All-time top TOP_N as JSON-ready dicts, for the shared snapshot cache.
+
+    Read from the database (idx_user_total_score) rather than this process's
+    index: whichever worker rebuilds the shared snapshot must include scores
+    saved by every other worker.
+    """
+    users = User.query.order_by(User.total_score.desc(), User.id).limit(TOP_N).all()
+    return [{
+        'user_id': user.id,
+        'rank': rank,
+        'username': user.username,
+        'score': user.total_score,
+        'level': user.level,
+        'words_mastered': user.words_mastered,
+        'sentences_mastered': user.sentences_mastered,
+        'streak': user.current_streak
+    } for rank, user in enumerate(users, 1)]
+
+
+def update_score(user_id, total_score):
+    """Move a user in the rank index, expiring the shared top snapshot if the top changed"""
+    if leaderboard.update(user_id, total_score):
+        snapshots.invalidate(TOP_SNAPSHOT)
+
+
+# ==================== TIME WINDOWS ====================
+
+WINDOWS = ('daily', 'weekly', 'monthly')
+
+# Rows per windowed snapshot
+WINDOW_TOP_N = 50
+
+
+def window_start(window, today):
+    """First UTC day of the calendar window containing `today`"""
+    if window == 'daily':
+        return today
+    if window == 'weekly':
+        return today - timedelta(days=today.weekday())
+    return today.replace(day=1)
+
+
+class WindowedLeaderboard:
+    """Per-user score totals since the start of one calendar window"""
+
+    # Minimum seconds between snapshot rebuilds while scores keep changing
+    SNAPSHOT_INTERVAL = 5
+
+    def __init__(self, window, ttl=300):
+        self.window = window
+        self.ttl = ttl
+        self.start = None
+        self.scores = {}
+        self.quizzes = {}
+        self.version = 0
+        self._loaded_at = None
+        self._published = (None, 0)
+        self._published_at = 0.0
+        self._lock = threading.Lock()
+
+    def ensure_fresh(self):
+        """Reload from the daily rollup when the window rolls over or the TTL passes"""
+        start = window_start(self.window, datetime.utcnow().date())
+        if start == self.start and self._loaded_at is not None \
+                and time.monotonic() - self._loaded_at <= self.ttl:
+            return
+
+        rows = db.session.query(
+            UserDailyActivity.user_id,
+            db.func.sum(UserDailyActivity.total_score),
+            db.func.sum(UserDailyActivity.quiz_count)
+        ).filter(UserDailyActivity.date >= start).group_by(UserDailyActivity.user_id).all()
+
+        with self._lock:
+            self.start = start
+            self.scores = {user_id: int(score or 0) for user_id, score, _ in rows}
+            self.quizzes = {user_id: int(count or 0) for user_id, _, count in rows}
+            self.version += 1
+            self._loaded_at = time.monotonic()
+
+    def add(self, user_id, score, day):
+        """Count a just-saved quiz if it falls inside the loaded window"""
+        with self._lock:
+            if self.start is None or day < self.start:
+                return
+            self.scores[user_id] = self.scores.get(user_id, 0) + score
+            self.quizzes[user_id] = self.quizzes.get(user_id, 0) + 1
+            self.version += 1
+
+    def remove(self, user_id):
+        with self._lock:
+            if self.scores.pop(user_id, None) is not None:
+                self.quizzes.pop(user_id, None)
+                self.version += 1
+
+    def snapshot_key(self):
+        """(window start, version) of the snapshot to serve, adopting new versions at most every SNAPSHOT_INTERVAL"""
+        with self._lock:
+            now = time.monotonic()
+            if self._published != (self.start, self.version) and (
+                    self._published[0] != self.start or now - self._published_at >= self.SNAPSHOT_INTERVAL):
+                self._published = (self.start, self.version)
+                self._published_at = now
+            return self._published
+
+    def top(self, count):
+        """Return [(user_id, score, quizzes)] for the `count` best users, best first"""
+        with self._lock:
+            best = heapq.nlargest(count, self.scores.items(), key=lambda entry: entry[1])
+            quizzes = {user_id: self.quizzes.get(user_id, 0) for user_id, _ in best}
+        best.sort(key=lambda entry: (-entry[1], entry[0]))
+        return [(user_id, score, quizzes[user_id]) for user_id, score in best]
+
+    def build_snapshot(self):
+        entries = self.top(WINDOW_TOP_N)
+        users_by_id = {user.id: user for user in
+                       User.query.filter(User.id.in_([user_id for user_id, _, _ in entries])).all()}
+
+        board = []
+        for user_id, score, quizzes in entries:
+            user = users_by_id.get(user_id)
+            if user is None:
+                continue
+            board.append({
+                'rank': len(board) + 1,
+                'username': user.username,
+                'score': score,
+                'quizzes': quizzes,
+                'level': user.level
+            })
+
+        return {
+            'success': True,
+            'window': self.window,
+            'start': self.start.isoformat(),
+            'leaderboard': board
+        }
+
+
+windowed_leaderboards = {window: WindowedLeaderboard(window) for window in WINDOWS}
+
+# Serialized windowed snapshots keyed by (window start, version)
+leaderboard_payloads = PayloadCache()
+
+
+def window_payload(window):
+    """Return the PrecompressedPayload snapshot for a time window"""
+    board = windowed_leaderboards[window]
+    board.ensure_fresh()
+    return leaderboard_payloads.get(f'leaderboard:{window}', board.snapshot_key(), board.build_snapshot)
+
+
+def record_quiz_score(user_id, total_score, quiz_result):
+    """Reflect a saved quiz in the all-time index and every windowed board"""
+    update_score(user_id, total_score)
+    day = quiz_result.timestamp.date()
+    for board in windowed_leaderboards.values():
+        board.add(user_id, quiz_result.score, day)
+
+
+def forget_user(user_id):
+    """Drop a deleted user from every in-process leaderboard"""
+    if leaderboard.remove(user_id):
+        snapshots.invalidate(TOP_SNAPSHOT)
+    for board in windowed_leaderboards.values():
+        board.remove(user_id)
@@ -1,5 +1,8 @@
 from flask import Blueprint, render_template, jsonify
-from flask_login import login_required, current_user 
+from flask_login import login_required, current_user
+
+from .corpus import get_corpus
+from .http_cache import catalog_payloads, send_payload
 
 # Create blueprint
 learn_bp = Blueprint('learn', __name__)
@@ -10,38 +13,64 @@ def learn_page():
     """Serve the learn.html page"""
     return render_template('learn.html')
 
+def format_learn_words(words):
+    """Project the words corpus to the fields the learn page uses"""
+    # Pass ALL word data to the frontend
+    formatted_words = []
+    for word in (item.to_dict() for item in words):
+        formatted_word = {
+            'word': word.get('word', ''),
+            'pinyin': word.get('pinyin', ''),
+            'meaning': word.get('meaning', ''),
+            'translation': word.get('translation', ''),
+            'definition': word.get('definition', ''),
+            'example': word.get('example', ''),
+            # Include any other fields your words have
+            'partOfSpeech': word.get('partOfSpeech', ''),
+            'usage': word.get('usage', ''),
+            'notes': word.get('notes', '')
+        }
+        # Remove empty fields
+        formatted_word = {k: v for k, v in formatted_word.items() if v}
+        formatted_words.append(formatted_word)
+    return formatted_words
+
+def format_learn_sentences(sentences):
+    """Project the sentences corpus to the fields the learn page uses"""
+    # Pass ALL sentence data to the frontend
+    formatted_sentences = []
+    for sentence in (item.to_dict() for item in sentences):
+        formatted_sentence = {
+            'sentence': sentence.get('sentence', ''),
+            'pinyin': sentence.get('pinyin', ''),
+            'translation': sentence.get('translation', ''),
+            'meaning': sentence.get('meaning', ''),
+            'definition': sentence.get('definition', ''),
+            'notes': sentence.get('notes', ''),
+            'example': sentence.get('example', ''),
+            # Include any other fields your sentences have
+            'structure': sentence.get('structure', ''),
+            'grammar': sentence.get('grammar', ''),
+            'usage': sentence.get('usage', '')
+        }
+        # Remove empty fields
+        formatted_sentence = {k: v for k, v in formatted_sentence.items() if v}
+        formatted_sentences.append(formatted_sentence)
+    return formatted_sentences
+
 @learn_bp.route('/words/api/all-words')
 @login_required  # ADD THIS DECORATOR
 def get_all_words():
     """API endpoint to get all HSK1 words for learning"""
     try:
-        # Import your actual words data
-        from .words_routes import HSK1_WORDS
-        
-        # Pass ALL word data to the frontend
-        formatted_words = []
-        for word in HSK1_WORDS:
-            formatted_word = {
-                'word': word.get('word', ''),
-                'pinyin': word.get('pinyin', ''),
-                'meaning': word.get('meaning', ''),
-                'translation': word.get('translation', ''),
-                'definition': word.get('definition', ''),
-                'example': word.get('example', ''),
-                # Include any other fields your words have
-                'partOfSpeech': word.get('partOfSpeech', ''),
-                'usage': word.get('usage', ''),
-                'notes': word.get('notes', '')
-            }
-            # Remove empty fields
-            formatted_word = {k: v for k, v in formatted_word.items() if v}
-            formatted_words.append(formatted_word)
-        
-        return jsonify({
+        # Projection is serialized and compressed once per corpus version
+        words = get_corpus('words')
+        payload = catalog_payloads.get('learn:words', words.version, lambda: {
             'success': True,
-            'words': formatted_words
+            'words': format_learn_words(words)
         })
-        
+        return send_payload(payload, cache_control='private, no-cache')
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -53,36 +82,16 @@ def get_all_words():
 def get_all_sentences():
     """API endpoint to get all HSK1 sentences for learning"""
     try:
-        # Import your actual sentences data
-        from .sentence_routes import HSK1_SENTENCES
-        
-        # Pass ALL sentence data to the frontend
-        formatted_sentences = []
-        for sentence in HSK1_SENTENCES:
-            formatted_sentence = {
-                'sentence': sentence.get('sentence', ''),
-                'pinyin': sentence.get('pinyin', ''),
-                'translation': sentence.get('translation', ''),
-                'meaning': sentence.get('meaning', ''),
-                'definition': sentence.get('definition', ''),
-                'notes': sentence.get('notes', ''),
-                'example': sentence.get('example', ''),
-                # Include any other fields your sentences have
-                'structure': sentence.get('structure', ''),
-                'grammar': sentence.get('grammar', ''),
-                'usage': sentence.get('usage', '')
-            }
-            # Remove empty fields
-            formatted_sentence = {k: v for k, v in formatted_sentence.items() if v}
-            formatted_sentences.append(formatted_sentence)
-        
-        return jsonify({
+        # Projection is serialized and compressed once per corpus version
+        sentences = get_corpus('sentences')
+        payload = catalog_payloads.get('learn:sentences', sentences.version, lambda: {
             'success': True,
-            'sentences': formatted_sentences
+            'sentences': format_learn_sentences(sentences)
         })
-        
+        return send_payload(payload, cache_control='private, no-cache')
+
     except Exception as e:
         return jsonify({
             'success': False,
             'message': f'Error retrieving sentences: {str(e)}'
-        }), 500
\ No newline at end of file
+        }), 500
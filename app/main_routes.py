@@ -1,11 +1,12 @@
 from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for
-from datetime import datetime, timedelta  # Added timedelta import
 from flask_login import login_required, current_user  # Added this import
-import json
-import uuid
 
 # Import db and models from your models.py
-from .models import db, QuizResult, User
+from .models import db, QuizResult, User, UserQuizStats
+from .http_cache import send_payload
+from .leaderboard import TOP_N, TOP_SNAPSHOT, WINDOWS, build_top_snapshot, leaderboard, window_payload
+from .snapshot_cache import snapshots
+from .quiz_ingest import QuizResultError, build_result, ingest_result
 
 # Create Blueprint
 main_bp = Blueprint('main', __name__)
@@ -36,33 +37,19 @@ def exam():
 def save_quiz_result():
     """API endpoint to save quiz results to database"""
     try:
-        data = request.get_json()
-        user_id = current_user.id  # Changed from session to current_user
-        
-        print(f"💾 Saving quiz result for user_id: {user_id}")
-        
-        # Create new quiz result
-        quiz_result = QuizResult(
-            quiz_type=data.get('quiz_type', 'words'),
-            score=data.get('score', 0),
-            total_questions=data.get('total_questions', 0),
-            correct_answers=data.get('correct_answers', 0),
-            incorrect_answers=data.get('incorrect_answers', 0),
-            percentage=data.get('percentage', 0),
-            time_taken=data.get('time_taken', 0),
-            timestamp=datetime.utcnow(),
-            user_id=user_id  # Associate with user
-        )
-        
-        # Set user answers using the model method
-        quiz_result.set_user_answers(data.get('user_answers', []))
-        
-        db.session.add(quiz_result)
-        db.session.commit()
+        data = request.get_json(silent=True)
+        quiz_result = build_result(current_user.id, data)
+    except QuizResultError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    try:
+        print(f"💾 Saving quiz result for user_id: {current_user.id}")
         
-        # Update user's progress in the database
-        if user_id:
-            update_user_progress(user_id, data)
+        # Same single-transaction pipeline as /api/save-quiz-result
+        ingest_result(quiz_result, data.get('user_answers', []))
         
         return jsonify({
             'success': True,
@@ -71,93 +58,11 @@ def save_quiz_result():
         })
         
     except Exception as e:
-        db.session.rollback()
         return jsonify({
             'success': False,
             'message': f'Error saving quiz result: {str(e)}'
         }), 500
 
-def update_user_progress(user_id, quiz_data):
-    """Update user's progress after quiz completion"""
-    try:
-        user = User.query.get(user_id)
-        if not user:
-            print(f"❌ User {user_id} not found for progress update")
-            return
-        
-        quiz_type = quiz_data.get('quiz_type', 'words')
-        correct_answers = quiz_data.get('correct_answers', 0)
-        percentage = quiz_data.get('percentage', 0)
-        
-        print(f"📈 Updating progress for user {user.username}: {quiz_type} quiz, {correct_answers} correct, {percentage}%")
-        
-        # Update words/sentences mastered based on quiz type
-        if quiz_type == 'words' and percentage >= 80:  # Consider mastered if 80%+ correct
-            new_words_mastered = max(user.words_mastered or 0, correct_answers)
-            user.words_mastered = new_words_mastered
-            print(f"   📝 Words mastered updated to: {new_words_mastered}")
-        
-        elif quiz_type == 'sentences' and percentage >= 80:
-            new_sentences_mastered = max(user.sentences_mastered or 0, correct_answers)
-            user.sentences_mastered = new_sentences_mastered
-            print(f"   📝 Sentences mastered updated to: {new_sentences_mastered}")
-        
-        # Update accuracy rate (average of all quizzes)
-        user_quizzes = QuizResult.query.filter_by(user_id=user_id).all()
-        total_correct = sum(quiz.correct_answers for quiz in user_quizzes)
-        total_questions = sum(quiz.total_questions for quiz in user_quizzes)
-        
-        if total_questions > 0:
-            user.accuracy_rate = round((total_correct / total_questions) * 100, 1)
-            print(f"   🎯 Accuracy rate updated to: {user.accuracy_rate}%")
-        
-        # Update streak
-        today = datetime.utcnow().date()
-        last_activity = user.last_activity_date.date() if user.last_activity_date else None
-        
-        if last_activity == today - timedelta(days=1):
-            user.current_streak += 1
-            print(f"   🔥 Streak increased to: {user.current_streak} days")
-        elif last_activity != today:
-            user.current_streak = 1
-            print(f"   🔥 New streak started: 1 day")
-        
-        user.last_activity_date = datetime.utcnow()
-        
-        # Calculate total score
-        user.total_score = calculate_user_score(user)
-        print(f"   🏆 Total score updated to: {user.total_score}")
-        
-        db.session.commit()
-        print(f"✅ Successfully updated progress for {user.username}")
-        
-    except Exception as e:
-        print(f"❌ Error updating user progress: {str(e)}")
-        db.session.rollback()
-
-def calculate_user_score(user):
-    """Calculate user score based on their progress"""
-    words_mastered = user.words_mastered or 0
-    sentences_mastered = user.sentences_mastered or 0
-    current_streak = user.current_streak or 0
-    accuracy_rate = user.accuracy_rate or 0
-    
-    word_score = words_mastered * 10
-    sentence_score = sentences_mastered * 15
-    streak_bonus = current_streak * 5
-    accuracy_bonus = accuracy_rate * 2
-    
-    total_score = word_score + sentence_score + streak_bonus + accuracy_bonus
-    
-    print(f"   🧮 Score calculation for {user.username}:")
-    print(f"     {words_mastered} words × 10 = {word_score}")
-    print(f"     {sentences_mastered} sentences × 15 = {sentence_score}")
-    print(f"     {current_streak} streak × 5 = {streak_bonus}")
-    print(f"     {accuracy_rate}% accuracy × 2 = {accuracy_bonus}")
-    print(f"     TOTAL: {total_score}")
-    
-    return total_score
-
 @main_bp.route('/api/quiz-results/<int:result_id>')
 @login_required
 def get_quiz_result(result_id):
@@ -202,23 +107,24 @@ def get_quiz_stats():
     try:
         user_id = current_user.id  # Changed from session to current_user
         
-        # Get user-specific stats
-        user_quizzes = QuizResult.query.filter_by(user_id=user_id).all()
-        total_quizzes = len(user_quizzes)
-        words_quizzes = len([q for q in user_quizzes if q.quiz_type == 'words'])
-        sentence_quizzes = len([q for q in user_quizzes if q.quiz_type == 'sentences'])
+        # Get user-specific stats from the per-type rollup rows
+        stats = UserQuizStats.for_user(user_id)
+        empty = UserQuizStats(quiz_count=0)
+        all_stats = stats.get(UserQuizStats.ALL, empty)
+        words_stats = stats.get('words', empty)
+        sentence_stats = stats.get('sentences', empty)
+        
+        total_quizzes = all_stats.quiz_count
+        words_quizzes = words_stats.quiz_count
+        sentence_quizzes = sentence_stats.quiz_count
         
         # Calculate user averages
-        words_avg = db.session.query(db.func.avg(QuizResult.percentage))\
-            .filter_by(quiz_type='words', user_id=user_id).scalar() or 0
-        sentence_avg = db.session.query(db.func.avg(QuizResult.percentage))\
-            .filter_by(quiz_type='sentences', user_id=user_id).scalar() or 0
+        words_avg = words_stats.average_percentage
+        sentence_avg = sentence_stats.average_percentage
         
         # Get user best scores
-        words_best = db.session.query(db.func.max(QuizResult.percentage))\
-            .filter_by(quiz_type='words', user_id=user_id).scalar() or 0
-        sentence_best = db.session.query(db.func.max(QuizResult.percentage))\
-            .filter_by(quiz_type='sentences', user_id=user_id).scalar() or 0
+        words_best = words_stats.best_percentage or 0
+        sentence_best = sentence_stats.best_percentage or 0
         
         # Get recent activity for current user
         recent_quizzes = QuizResult.query.filter_by(user_id=user_id)\
@@ -235,6 +141,9 @@ def get_quiz_stats():
         # Get current user's rank on leaderboard
         user_rank = get_user_rank(user_id)
         
+        # Community-wide figures are the same for everyone; share one snapshot
+        community = snapshots.get(COMMUNITY_SNAPSHOT, build_community_stats)
+        
         return jsonify({
             'success': True,
             'stats': {
@@ -250,7 +159,9 @@ def get_quiz_stats():
                 'user_rank': user_rank,
                 'username': current_user.username,
                 'user_score': current_user.total_score if hasattr(current_user, 'total_score') else 0,
-                'user_level': current_user.level if hasattr(current_user, 'level') else 1
+                'user_level': current_user.level if hasattr(current_user, 'level') else 1,
+                'total_users': community['total_users'],
+                'community': community
             }
         })
         
@@ -260,18 +171,29 @@ def get_quiz_stats():
             'message': f'Error retrieving stats: {str(e)}'
         }), 500
 
+# Snapshot cache name for the community-wide part of /api/stats
+COMMUNITY_SNAPSHOT = 'community-stats'
+
+def build_community_stats():
+    """Totals across all users from the 'all' rollup rows"""
+    total_users, active_users, total_quizzes, total_percentage = db.session.query(
+        db.select(db.func.count(User.id)).scalar_subquery(),
+        db.func.count(UserQuizStats.user_id),
+        db.func.coalesce(db.func.sum(UserQuizStats.quiz_count), 0),
+        db.func.coalesce(db.func.sum(UserQuizStats.total_percentage), 0.0)
+    ).filter(UserQuizStats.quiz_type == UserQuizStats.ALL).one()
+    
+    return {
+        'total_users': total_users,
+        'active_users': active_users,
+        'total_quizzes': int(total_quizzes),
+        'average_percentage': round(float(total_percentage) / total_quizzes, 1) if total_quizzes else 0.0
+    }
+
 def get_user_rank(user_id):
-    """Calculate user's rank based on total_score"""
+    """Look up user's rank by total_score in the leaderboard index"""
     try:
-        # Get all users ordered by total_score descending
-        users = User.query.order_by(User.total_score.desc()).all()
-        
-        # Find the user's position
-        for i, user in enumerate(users, start=1):
-            if user.id == user_id:
-                return i
-        
-        return None
+        return leaderboard.rank(user_id)
     except Exception as e:
         print(f"Error calculating user rank: {e}")
         return None
@@ -282,7 +204,7 @@ def debug_user_progress():
     """Debug endpoint to check user progress"""
     try:
         user_id = current_user.id  # Changed from session to current_user
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             return jsonify({
                 'success': False,
@@ -327,30 +249,34 @@ def debug_user_progress():
 @main_bp.route('/api/leaderboard')
 @login_required
 def get_leaderboard():
-    """Get global leaderboard data"""
+    """Get global leaderboard data.
+
+    ?window=daily|weekly|monthly serves the shared, ETag'd snapshot for that
+    calendar window instead of the all-time board.
+    """
     try:
-        # Get top 50 users by total_score
-        top_users = User.query.order_by(User.total_score.desc()).limit(50).all()
+        window = request.args.get('window', 'all')
+        if window in WINDOWS:
+            return send_payload(window_payload(window), cache_control='private, no-cache')
+        if window != 'all':
+            return jsonify({
+                'success': False,
+                'message': f"window must be one of: all, {', '.join(WINDOWS)}"
+            }), 400
         
-        leaderboard_data = []
-        for i, user in enumerate(top_users, start=1):
-            leaderboard_data.append({
-                'rank': i,
-                'username': user.username,
-                'score': user.total_score,
-                'level': user.level if hasattr(user, 'level') else 1,
-                'words_mastered': user.words_mastered,
-                'sentences_mastered': user.sentences_mastered,
-                'streak': user.current_streak,
-                'is_current_user': user.id == current_user.id
-            })
+        # Top 50 come from the snapshot shared by all workers; only the flag is per-user
+        leaderboard_data = [
+            {**{key: value for key, value in entry.items() if key != 'user_id'},
+             'is_current_user': entry['user_id'] == current_user.id}
+            for entry in snapshots.get(TOP_SNAPSHOT, build_top_snapshot)
+        ]
         
         # Find current user's rank if not in top 50
         current_user_rank = get_user_rank(current_user.id)
         current_user_data = None
         
-        if current_user_rank and current_user_rank > 50:
-            user = User.query.get(current_user.id)
+        if current_user_rank and current_user_rank > TOP_N:
+            user = current_user
             current_user_data = {
                 'rank': current_user_rank,
                 'username': user.username,
@@ -373,4 +299,50 @@ def get_leaderboard():
         return jsonify({
             'success': False,
             'message': f'Error retrieving leaderboard: {str(e)}'
-        }), 500
\ No newline at end of file
+        }), 500
+
+# Largest ?radius= accepted by /api/leaderboard/around-me
+MAX_AROUND_RADIUS = 25
+
+@main_bp.route('/api/leaderboard/around-me')
+@login_required
+def get_leaderboard_around_me():
+    """Get the users ranked just above and below the current user"""
+    try:
+        try:
+            radius = min(max(int(request.args.get('radius', 5)), 0), MAX_AROUND_RADIUS)
+        except ValueError:
+            return jsonify({'success': False, 'message': 'radius must be an integer'}), 400
+        
+        # One index walk for the neighbourhood, one IN query for the rows
+        current_user_rank, entries = leaderboard.around(current_user.id, radius)
+        users_by_id = {user.id: user for user in
+                       User.query.filter(User.id.in_([user_id for _, user_id, _ in entries])).all()}
+        
+        neighbours = []
+        for rank, user_id, score in entries:
+            user = users_by_id.get(user_id)
+            if user is None:
+                continue
+            neighbours.append({
+                'rank': rank,
+                'username': user.username,
+                'score': score,
+                'level': user.level,
+                'streak': user.current_streak,
+                'is_current_user': user.id == current_user.id
+            })
+        
+        return jsonify({
+            'success': True,
+            'radius': radius,
+            'current_user_rank': current_user_rank,
+            'total_users': len(leaderboard),
+            'leaderboard': neighbours
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error retrieving leaderboard: {str(e)}'
+        }), 500
@@ -1,12 +1,15 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import json
+import math
 import uuid
 import secrets
 import hashlib
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 
+from .session_cache import SESSION_MAX_AGE, session_cache
+
 # Initialize SQLAlchemy
 db = SQLAlchemy()
 
@@ -87,19 +90,12 @@ class UserAuth(db.Model):
     def revoke_all_sessions(self, exclude_token=None):
         """Revoke all active sessions except the specified one"""
         from app.models import UserSession
-        sessions = UserSession.query.filter_by(
-            user_auth_id=self.id,
-            is_active=True
-        ).all()
-        
-        for session in sessions:
-            if exclude_token and session.session_token == exclude_token:
-                continue
-            session.is_active = False
-            session.logout_time = datetime.utcnow()
+        revoked = UserSession.revoke_for(self.id, exclude_token=exclude_token)
         
         db.session.commit()
-        return len(sessions)
+        if revoked:
+            session_cache.notify_revoked(self.id)
+        return revoked
     
     def can_login(self):
         """Check if user can login"""
@@ -141,11 +137,63 @@ class UserSession(db.Model):
             'is_active': self.is_active
         }
     
+    @classmethod
+    def revoke_for(cls, user_auth_id, session_token=None, exclude_token=None):
+        """Deactivate a user's active sessions (or one of them) in a single UPDATE; returns the row count.
+
+        Doesn't commit; if any rows changed, call session_cache.notify_revoked() after committing.
+        """
+        query = db.update(cls).where(cls.user_auth_id == user_auth_id, cls.is_active == True)
+        if session_token is not None:
+            query = query.where(cls.session_token == session_token)
+        if exclude_token is not None:
+            query = query.where(cls.session_token != exclude_token)
+        
+        return db.session.execute(
+            query.values(is_active=False, logout_time=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    
+    @classmethod
+    def expire_stale(cls, batch_size=500, now=None):
+        """Deactivate sessions older than SESSION_MAX_AGE, batch_size rows per commit; returns the count"""
+        now = now or datetime.utcnow()
+        condition = db.and_(cls.is_active == True, cls.login_time < now - SESSION_MAX_AGE)
+        return cls._in_batches(
+            lambda ids: db.update(cls).where(cls.id.in_(ids))
+            .values(is_active=False, logout_time=now),
+            condition, batch_size)
+    
+    @classmethod
+    def prune(cls, retention, batch_size=500, now=None):
+        """Delete sessions that ended more than `retention` ago, batch_size rows per commit; returns the count"""
+        now = now or datetime.utcnow()
+        condition = db.and_(cls.is_active == False,
+                            db.func.coalesce(cls.logout_time, cls.login_time) < now - retention)
+        return cls._in_batches(lambda ids: db.delete(cls).where(cls.id.in_(ids)), condition, batch_size)
+    
+    @classmethod
+    def _in_batches(cls, make_statement, condition, batch_size):
+        """Run make_statement(id subquery) over rows matching condition until none are left"""
+        total = 0
+        while True:
+            ids = db.select(cls.id).where(condition).limit(batch_size).scalar_subquery()
+            count = db.session.execute(
+                make_statement(ids).execution_options(synchronize_session=False)
+            ).rowcount
+            db.session.commit()
+            total += count
+            if count < batch_size:
+                return total
+    
     def revoke(self):
         """Revoke this session"""
+        was_active = self.is_active
         self.is_active = False
         self.logout_time = datetime.utcnow()
         db.session.commit()
+        if was_active:
+            session_cache.notify_revoked(self.user_auth_id)
     
     def __repr__(self):
         return f'<UserSession {self.session_token[:8]}...>'
@@ -180,21 +228,483 @@ class QuizResult(db.Model):
     user_answers = db.Column(db.Text)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
+    # Digest of the quiz token for server-graded results; each token is graded once per user
+    quiz_token_hash = db.Column(db.String(64))
+    
     # Link to user
     user_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=True, index=True)
     
     __table_args__ = (
         db.Index('idx_quiz_user_timestamp', 'user_id', 'quiz_type', 'timestamp'),
+        db.Index('idx_quiz_user_recent', 'user_id', 'timestamp', 'id'),
         db.Index('idx_quiz_timestamp', 'quiz_type', 'timestamp'),
+        db.Index('idx_quiz_user_token', 'user_id', 'quiz_token_hash', unique=True),
     )
     
     def get_user_answers(self):
         if self.user_answers:
             return json.loads(self.user_answers)
-        return []
+        return QuizAnswer.for_results([self.id]).get(self.id, [])
     
     def set_user_answers(self, answers_list):
         self.user_answers = json.dumps(answers_list)
+    
+    def store_answers(self, answers_list):
+        """Store answers as QuizAnswer rows when every entry names its item, else as the JSON blob.
+
+        The result must already be added to the session.
+        """
+        rows = QuizAnswer.normalize(answers_list)
+        if rows is None:
+            self.set_user_answers(answers_list)
+            return
+        
+        db.session.flush()  # assigns self.id
+        QuizAnswer.bulk_insert(self, rows)
+
+class QuizAnswer(db.Model):
+    """One answered question of a QuizResult"""
+    __tablename__ = 'quiz_answers'
+    
+    result_id = db.Column(db.Integer, db.ForeignKey('quiz_results.id'), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)  # words, sentences
+    item_id = db.Column(db.Integer, nullable=False)
+    chosen = db.Column(db.Integer)  # option index, NULL when unanswered
+    correct = db.Column(db.Boolean, nullable=False)
+    latency_ms = db.Column(db.Integer)
+    
+    __table_args__ = (
+        db.Index('idx_answer_item', 'kind', 'item_id'),
+    )
+    
+    # Latencies above this (one hour) are stored as this
+    MAX_LATENCY_MS = 3600 * 1000
+    
+    @staticmethod
+    def _is_int(value):
+        return isinstance(value, int) and not isinstance(value, bool)
+    
+    @classmethod
+    def normalize(cls, answers_list):
+        """Map answer dicts to column values, or return None if any entry lacks an item id.
+
+        Raises ValueError for entries that name an item but carry an invalid
+        item_id, chosen or latency_ms.
+        """
+        if not answers_list or not isinstance(answers_list, list):
+            return None
+        
+        rows = []
+        for position, answer in enumerate(answers_list):
+            if not isinstance(answer, dict):
+                return None
+            item_id = answer.get('item_id', answer.get('id'))
+            if item_id is None:
+                return None
+            if not cls._is_int(item_id) or item_id < 0:
+                raise ValueError(f'user_answers[{position}]: item id must be a non-negative integer')
+            
+            chosen = answer.get('chosen')
+            if chosen is not None and (not cls._is_int(chosen) or chosen < 0):
+                raise ValueError(f'user_answers[{position}]: chosen must be a non-negative integer or null')
+            
+            latency = answer.get('latency_ms')
+            if latency is not None:
+                if not isinstance(latency, (int, float)) or isinstance(latency, bool) \
+                        or not math.isfinite(latency) or latency < 0:
+                    raise ValueError(f'user_answers[{position}]: latency_ms must be a non-negative number or null')
+                latency = min(int(latency), cls.MAX_LATENCY_MS)
+            
+            rows.append({
+                'item_id': item_id,
+                'chosen': chosen,
+                'correct': bool(answer.get('is_correct', answer.get('correct', False))),
+                'latency_ms': latency
+            })
+        return rows
+    
+    @classmethod
+    def bulk_insert(cls, quiz_result, rows):
+        """Insert all answers of a result in one executemany"""
+        db.session.execute(cls.__table__.insert(), [
+            dict(row, result_id=quiz_result.id, position=position, kind=quiz_result.quiz_type)
+            for position, row in enumerate(rows)
+        ])
+    
+    @classmethod
+    def for_results(cls, result_ids):
+        """Return {result_id: [answer dicts]} for many results with one query"""
+        answers = {}
+        if not result_ids:
+            return answers
+        
+        rows = cls.query.filter(cls.result_id.in_(result_ids))\
+            .order_by(cls.result_id, cls.position).all()
+        for row in rows:
+            answers.setdefault(row.result_id, []).append(row.to_dict())
+        return answers
+    
+    def to_dict(self):
+        return {
+            'id': self.item_id,
+            'chosen': self.chosen,
+            'is_correct': self.correct,
+            'latency_ms': self.latency_ms
+        }
+
+class UserSeenItems(db.Model):
+    """Bitset of corpus item ids already served to a user (bit N = item id N)"""
+    __tablename__ = 'user_seen_items'
+    
+    user_id = db.Column(db.String(36), db.ForeignKey('user.id'), primary_key=True)
+    kind = db.Column(db.String(20), primary_key=True)  # words, sentences
+    bits = db.Column(db.LargeBinary, nullable=False, default=b'')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<UserSeenItems {self.kind} for {self.user_id}>'
+
+def sql_greatest(column, value):
+    """SQL max(column, value) treating NULL as unset (portable, unlike GREATEST/MAX)"""
+    return db.case((db.or_(column.is_(None), column < value), value), else_=column)
+
+def sql_least(column, value):
+    """SQL min(column, value) treating NULL as unset"""
+    return db.case((db.or_(column.is_(None), column > value), value), else_=column)
+
+def upsert(model, values, on_conflict):
+    """INSERT a row, or apply on_conflict ({column: SQL expression}) to the existing one.
+
+    One statement, so two transactions creating the same key can't collide.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(model).values(**values).on_duplicate_key_update(**on_conflict)
+    else:
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        statement = insert(model).values(**values).on_conflict_do_update(
+            index_elements=[column.name for column in model.__table__.primary_key.columns],
+            set_=on_conflict
+        )
+    db.session.execute(statement)
+
+class UserQuizStats(db.Model):
+    """Running quiz totals per user and quiz type, kept in step with quiz_results.
+
+    Each save updates its quiz_type row and the combined 'all' row in the same
+    transaction, so stats endpoints read one row instead of every result.
+    """
+    __tablename__ = 'user_quiz_stats'
+    
+    ALL = 'all'
+    
+    user_id = db.Column(db.String(36), db.ForeignKey('user.id'), primary_key=True)
+    quiz_type = db.Column(db.String(20), primary_key=True)  # words, sentences, all
+    quiz_count = db.Column(db.Integer, nullable=False, default=0)
+    total_score = db.Column(db.Integer, nullable=False, default=0)
+    total_percentage = db.Column(db.Float, nullable=False, default=0.0)
+    total_time = db.Column(db.Integer, nullable=False, default=0)
+    total_correct = db.Column(db.Integer, nullable=False, default=0)
+    total_incorrect = db.Column(db.Integer, nullable=False, default=0)
+    total_questions = db.Column(db.Integer, nullable=False, default=0)
+    best_score = db.Column(db.Integer)
+    worst_score = db.Column(db.Integer)
+    best_percentage = db.Column(db.Float)
+    perfect_count = db.Column(db.Integer, nullable=False, default=0)
+    last_quiz_at = db.Column(db.DateTime)
+    
+    def add_result(self, quiz_result):
+        """Fold one quiz result into the running totals"""
+        self.quiz_count = (self.quiz_count or 0) + 1
+        self.total_score = (self.total_score or 0) + quiz_result.score
+        self.total_percentage = (self.total_percentage or 0) + quiz_result.percentage
+        self.total_time = (self.total_time or 0) + (quiz_result.time_taken or 0)
+        self.total_correct = (self.total_correct or 0) + quiz_result.correct_answers
+        self.total_incorrect = (self.total_incorrect or 0) + quiz_result.incorrect_answers
+        self.total_questions = (self.total_questions or 0) + quiz_result.total_questions
+        self.best_score = quiz_result.score if self.best_score is None else max(self.best_score, quiz_result.score)
+        self.worst_score = quiz_result.score if self.worst_score is None else min(self.worst_score, quiz_result.score)
+        self.best_percentage = quiz_result.percentage if self.best_percentage is None else max(self.best_percentage, quiz_result.percentage)
+        self.perfect_count = (self.perfect_count or 0) + (quiz_result.percentage >= 100)
+        self.last_quiz_at = max(filter(None, (self.last_quiz_at, quiz_result.timestamp)), default=None)
+    
+    @classmethod
+    def increments(cls, quiz_result):
+        """add_result() as SQL expressions over the stored row, for atomic updates"""
+        return {
+            'quiz_count': cls.quiz_count + 1,
+            'total_score': cls.total_score + quiz_result.score,
+            'total_percentage': cls.total_percentage + quiz_result.percentage,
+            'total_time': cls.total_time + (quiz_result.time_taken or 0),
+            'total_correct': cls.total_correct + quiz_result.correct_answers,
+            'total_incorrect': cls.total_incorrect + quiz_result.incorrect_answers,
+            'total_questions': cls.total_questions + quiz_result.total_questions,
+            'best_score': sql_greatest(cls.best_score, quiz_result.score),
+            'worst_score': sql_least(cls.worst_score, quiz_result.score),
+            'best_percentage': sql_greatest(cls.best_percentage, quiz_result.percentage),
+            'perfect_count': cls.perfect_count + (1 if quiz_result.percentage >= 100 else 0),
+            'last_quiz_at': sql_greatest(cls.last_quiz_at, quiz_result.timestamp)
+        }
+    
+    def increment(self, quiz_result):
+        """Like add_result() for a stored row, but as atomic SQL so concurrent saves are not lost"""
+        for key, value in type(self).increments(quiz_result).items():
+            setattr(self, key, value)
+    
+    @classmethod
+    def upsert_result(cls, quiz_result, **key):
+        """Add a result to the row with this key, creating it if missing, in one statement"""
+        row = cls(**key)
+        row.add_result(quiz_result)
+        values = {column.key: getattr(row, column.key) for column in cls.__mapper__.column_attrs}
+        upsert(cls, values, cls.increments(quiz_result))
+    
+    def combine(self, other):
+        """Combine another rollup row into this one (used to build the 'all' row)"""
+        self.quiz_count = (self.quiz_count or 0) + other.quiz_count
+        self.total_score = (self.total_score or 0) + other.total_score
+        self.total_percentage = (self.total_percentage or 0) + other.total_percentage
+        self.total_time = (self.total_time or 0) + other.total_time
+        self.total_correct = (self.total_correct or 0) + other.total_correct
+        self.total_incorrect = (self.total_incorrect or 0) + other.total_incorrect
+        self.total_questions = (self.total_questions or 0) + other.total_questions
+        self.best_score = max(filter(lambda v: v is not None, (self.best_score, other.best_score)), default=None)
+        self.worst_score = min(filter(lambda v: v is not None, (self.worst_score, other.worst_score)), default=None)
+        self.best_percentage = max(filter(lambda v: v is not None, (self.best_percentage, other.best_percentage)), default=None)
+        self.perfect_count = (self.perfect_count or 0) + other.perfect_count
+        self.last_quiz_at = max(filter(None, (self.last_quiz_at, other.last_quiz_at)), default=None)
+    
+    @property
+    def average_score(self):
+        return round(self.total_score / self.quiz_count, 2) if self.quiz_count else 0
+    
+    @property
+    def average_percentage(self):
+        return round(self.total_percentage / self.quiz_count, 2) if self.quiz_count else 0
+    
+    @property
+    def accuracy_rate(self):
+        """Correct answers over questions asked, in percent (same as User.accuracy_rate)"""
+        return round(self.total_correct * 100.0 / self.total_questions, 1) if self.total_questions else 0
+    
+    @classmethod
+    def rebuild(cls, user_id):
+        """Recompute a user's rows from quiz_results with one GROUP BY; returns {quiz_type: row}"""
+        cls.query.filter_by(user_id=user_id).delete()
+        
+        aggregates = db.session.query(
+            QuizResult.quiz_type,
+            db.func.count(QuizResult.id),
+            db.func.coalesce(db.func.sum(QuizResult.score), 0),
+            db.func.coalesce(db.func.sum(QuizResult.percentage), 0.0),
+            db.func.coalesce(db.func.sum(QuizResult.time_taken), 0),
+            db.func.coalesce(db.func.sum(QuizResult.correct_answers), 0),
+            db.func.coalesce(db.func.sum(QuizResult.incorrect_answers), 0),
+            db.func.coalesce(db.func.sum(QuizResult.total_questions), 0),
+            db.func.max(QuizResult.score),
+            db.func.min(QuizResult.score),
+            db.func.max(QuizResult.percentage),
+            db.func.sum(db.case((QuizResult.percentage >= 100, 1), else_=0)),
+            db.func.max(QuizResult.timestamp)
+        ).filter(QuizResult.user_id == user_id).group_by(QuizResult.quiz_type).all()
+        
+        rows = {}
+        if not aggregates:
+            return rows
+        
+        combined = cls(user_id=user_id, quiz_type=cls.ALL)
+        for (quiz_type, count, score, percentage, time_taken, correct, incorrect, questions,
+             best, worst, best_percentage, perfect, last_quiz_at) in aggregates:
+            row = cls(user_id=user_id, quiz_type=quiz_type, quiz_count=count,
+                      total_score=int(score), total_percentage=float(percentage),
+                      total_time=int(time_taken), total_correct=int(correct),
+                      total_incorrect=int(incorrect), total_questions=int(questions),
+                      best_score=best, worst_score=worst, best_percentage=best_percentage,
+                      perfect_count=int(perfect or 0), last_quiz_at=last_quiz_at)
+            combined.combine(row)
+            rows[quiz_type] = row
+        rows[cls.ALL] = combined
+        
+        db.session.add_all(rows.values())
+        return rows
+    
+    @classmethod
+    def for_user(cls, user_id):
+        """Return {quiz_type: row} for a user, backfilling from quiz_results if missing"""
+        rows = {row.quiz_type: row for row in cls.query.filter_by(user_id=user_id).all()}
+        if not rows and QuizResult.query.filter_by(user_id=user_id).first() is not None:
+            rows = cls.rebuild(user_id)
+            db.session.commit()
+        return rows
+    
+    @classmethod
+    def record(cls, quiz_result):
+        """Fold a just-added QuizResult into its rows; call before the commit that saves it.
+
+        Stored rows are updated with SQL increments and missing ones are
+        upserted, so concurrent first saves of a quiz type can't collide.
+        """
+        if not quiz_result.user_id:
+            return
+        
+        db.session.flush()
+        rows = {row.quiz_type: row for row in cls.query.filter_by(user_id=quiz_result.user_id).all()}
+        if not rows and QuizResult.query.filter(QuizResult.user_id == quiz_result.user_id,
+                                                QuizResult.id != quiz_result.id).first() is not None:
+            # History predates the rollup: the aggregate already includes the new result
+            cls.rebuild(quiz_result.user_id)
+            return
+        
+        for quiz_type in (quiz_result.quiz_type, cls.ALL):
+            row = rows.get(quiz_type)
+            if row is None:
+                cls.upsert_result(quiz_result, user_id=quiz_result.user_id, quiz_type=quiz_type)
+            else:
+                row.increment(quiz_result)
+    
+    def to_dict(self):
+        return {
+            'total_quizzes': self.quiz_count,
+            'average_score': self.average_score,
+            'average_percentage': self.average_percentage,
+            'total_time': self.total_time,
+            'best_score': self.best_score or 0,
+            'worst_score': self.worst_score or 0,
+            'total_correct': self.total_correct,
+            'total_incorrect': self.total_incorrect,
+            'accuracy_rate': self.accuracy_rate
+        }
+    
+    def __repr__(self):
+        return f'<UserQuizStats {self.quiz_type} for {self.user_id}>'
+
+class UserDailyActivity(db.Model):
+    """Quiz activity per user, UTC day and quiz type, for calendars and heatmaps.
+
+    Rows are updated in the same transaction as each save; backfill() rebuilds
+    them from quiz_results for users whose history predates this table.
+    """
+    __tablename__ = 'user_daily_activity'
+    
+    user_id = db.Column(db.String(36), db.ForeignKey('user.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    quiz_type = db.Column(db.String(20), primary_key=True)
+    quiz_count = db.Column(db.Integer, nullable=False, default=0)
+    total_score = db.Column(db.Integer, nullable=False, default=0)
+    total_correct = db.Column(db.Integer, nullable=False, default=0)
+    total_questions = db.Column(db.Integer, nullable=False, default=0)
+    total_time = db.Column(db.Integer, nullable=False, default=0)
+    best_percentage = db.Column(db.Float)
+    
+    __table_args__ = (
+        db.Index('idx_activity_date', 'date', 'user_id'),
+    )
+    
+    def add_result(self, quiz_result):
+        """Fold one quiz result into the day's totals"""
+        self.quiz_count = (self.quiz_count or 0) + 1
+        self.total_score = (self.total_score or 0) + quiz_result.score
+        self.total_correct = (self.total_correct or 0) + quiz_result.correct_answers
+        self.total_questions = (self.total_questions or 0) + quiz_result.total_questions
+        self.total_time = (self.total_time or 0) + (quiz_result.time_taken or 0)
+        self.best_percentage = quiz_result.percentage if self.best_percentage is None else max(self.best_percentage, quiz_result.percentage)
+    
+    @classmethod
+    def increments(cls, quiz_result):
+        """add_result() as SQL expressions over the stored row, for atomic updates"""
+        return {
+            'quiz_count': cls.quiz_count + 1,
+            'total_score': cls.total_score + quiz_result.score,
+            'total_correct': cls.total_correct + quiz_result.correct_answers,
+            'total_questions': cls.total_questions + quiz_result.total_questions,
+            'total_time': cls.total_time + (quiz_result.time_taken or 0),
+            'best_percentage': sql_greatest(cls.best_percentage, quiz_result.percentage)
+        }
+    
+    def increment(self, quiz_result):
+        """Like add_result() for a stored row, but as atomic SQL so concurrent saves are not lost"""
+        for key, value in type(self).increments(quiz_result).items():
+            setattr(self, key, value)
+    
+    @classmethod
+    def upsert_result(cls, quiz_result, **key):
+        """Add a result to the row with this key, creating it if missing, in one statement"""
+        row = cls(**key)
+        row.add_result(quiz_result)
+        values = {column.key: getattr(row, column.key) for column in cls.__mapper__.column_attrs}
+        upsert(cls, values, cls.increments(quiz_result))
+    
+    @classmethod
+    def record(cls, quiz_result):
+        """Fold a just-added QuizResult into its day row; call before the commit that saves it"""
+        if not quiz_result.user_id:
+            return
+        
+        day = (quiz_result.timestamp or datetime.utcnow()).date()
+        row = db.session.get(cls, (quiz_result.user_id, day, quiz_result.quiz_type))
+        if row is not None:
+            row.increment(quiz_result)
+            return
+        
+        db.session.flush()
+        if cls.query.filter_by(user_id=quiz_result.user_id).first() is None \
+                and QuizResult.query.filter(QuizResult.user_id == quiz_result.user_id,
+                                            QuizResult.id != quiz_result.id).first() is not None:
+            # History predates the rollup: rebuild it, which includes the new result
+            cls.backfill([quiz_result.user_id])
+            return
+        # Upserted, so a second tab's first save of the day can't collide with this one
+        cls.upsert_result(quiz_result, user_id=quiz_result.user_id, date=day, quiz_type=quiz_result.quiz_type)
+    
+    @classmethod
+    def backfill(cls, user_ids):
+        """Rebuild the rows of the given users from quiz_results with one GROUP BY; returns the row count"""
+        cls.query.filter(cls.user_id.in_(user_ids)).delete(synchronize_session=False)
+        
+        day = db.func.date(QuizResult.timestamp)
+        aggregates = db.session.query(
+            QuizResult.user_id,
+            day,
+            QuizResult.quiz_type,
+            db.func.count(QuizResult.id),
+            db.func.coalesce(db.func.sum(QuizResult.score), 0),
+            db.func.coalesce(db.func.sum(QuizResult.correct_answers), 0),
+            db.func.coalesce(db.func.sum(QuizResult.total_questions), 0),
+            db.func.coalesce(db.func.sum(QuizResult.time_taken), 0),
+            db.func.max(QuizResult.percentage)
+        ).filter(QuizResult.user_id.in_(user_ids))\
+            .group_by(QuizResult.user_id, day, QuizResult.quiz_type).all()
+        
+        rows = [
+            cls(user_id=user_id, date=date.fromisoformat(str(result_day)), quiz_type=quiz_type,
+                quiz_count=count, total_score=int(score), total_correct=int(correct),
+                total_questions=int(questions), total_time=int(time_taken),
+                best_percentage=best_percentage)
+            for (user_id, result_day, quiz_type, count, score, correct, questions,
+                 time_taken, best_percentage) in aggregates
+            if result_day is not None
+        ]
+        db.session.add_all(rows)
+        return len(rows)
+    
+    @classmethod
+    def backfill_all(cls, batch_size=200):
+        """Rebuild every user's rows in batches of users, committing per batch"""
+        user_ids = [user_id for (user_id,) in db.session.query(QuizResult.user_id)
+                    .filter(QuizResult.user_id.isnot(None)).distinct().order_by(QuizResult.user_id)]
+        total = 0
+        for start in range(0, len(user_ids), batch_size):
+            total += cls.backfill(user_ids[start:start + batch_size])
+            db.session.commit()
+        return len(user_ids), total
+    
+    def __repr__(self):
+        return f'<UserDailyActivity {self.date} {self.quiz_type} for {self.user_id}>'
 
 class User(db.Model, UserMixin):
     __tablename__ = 'user'
@@ -229,32 +739,55 @@ class User(db.Model, UserMixin):
         db.Index('idx_user_username', 'username'),
     )
     
+    @staticmethod
+    def streak_values(now=None):
+        """Column values that advance the daily streak, as SQL evaluated against the stored row.
+
+        Activity earlier today keeps the streak (starting it if it is 0),
+        activity yesterday extends it, and anything older restarts it at 1.
+        """
+        now = now or datetime.utcnow()
+        today = datetime(now.year, now.month, now.day)
+        streak = db.func.coalesce(User.current_streak, 0)
+        return {
+            'current_streak': db.case(
+                (User.last_activity_date >= today, db.case((streak == 0, 1), else_=streak)),
+                (User.last_activity_date >= today - timedelta(days=1), streak + 1),
+                else_=1
+            ),
+            'last_activity_date': now
+        }
+    
     def update_stats(self, quiz_result):
-        """Update user stats based on quiz result"""
-        from app.models import db
-        self.total_score += quiz_result.score
-        self.accuracy_rate = ((self.accuracy_rate or 0) + quiz_result.percentage) / 2
-        
+        """Apply a quiz result to this user's counters with one atomic UPDATE (the caller commits).
+
+        Scores and mastered counts are SQL increments and accuracy is read from
+        the 'all' UserQuizStats row, so concurrent saves for one user can't
+        overwrite each other. Call after UserQuizStats.record().
+        """
+        values = dict(self.streak_values())
+        values['total_score'] = db.func.coalesce(User.total_score, 0) + quiz_result.score
         if quiz_result.quiz_type == 'words':
-            self.words_mastered += quiz_result.correct_answers
+            values['words_mastered'] = db.func.coalesce(User.words_mastered, 0) + quiz_result.correct_answers
         elif quiz_result.quiz_type == 'sentences':
-            self.sentences_mastered += quiz_result.correct_answers
-        
-        # Update streak
-        today = datetime.utcnow().date()
-        last_activity = self.last_activity_date.date() if self.last_activity_date else None
+            values['sentences_mastered'] = db.func.coalesce(User.sentences_mastered, 0) + quiz_result.correct_answers
         
-        if last_activity:
-            days_diff = (today - last_activity).days
-            if days_diff == 1:
-                self.current_streak += 1
-            elif days_diff > 1:
-                self.current_streak = 1
-        else:
-            self.current_streak = 1
+        accuracy = db.select(
+            db.func.round(UserQuizStats.total_correct * 100.0 / UserQuizStats.total_questions, 1)
+        ).where(
+            UserQuizStats.user_id == self.id,
+            UserQuizStats.quiz_type == UserQuizStats.ALL,
+            UserQuizStats.total_questions > 0
+        ).scalar_subquery()
+        values['accuracy_rate'] = db.func.coalesce(accuracy, User.accuracy_rate)
         
-        self.last_activity_date = datetime.utcnow()
-        db.session.commit()
+        db.session.flush()  # rollup increments must land before the subquery reads them
+        db.session.execute(
+            db.update(User).where(User.id == self.id).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.expire(self, ['total_score', 'words_mastered', 'sentences_mastered',
+                                 'accuracy_rate', 'current_streak', 'last_activity_date'])
     
     def get_leaderboard_data(self):
         """Get data for leaderboard display"""
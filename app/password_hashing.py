@@ -0,0 +1,142 @@
+"""
+Password hashing off the request thread.
+
+Werkzeug's KDF is deliberately slow, so hashing and checking passwords on
+request threads lets a burst of logins starve quiz and results traffic. The
+work runs in a small ProcessPoolExecutor (PASSWORD_HASH_WORKERS processes)
+instead. A semaphore caps the calls queued or running at PASSWORD_HASH_QUEUE;
+past that, PasswordHasherBusy is raised immediately and the app answers 503
+rather than piling up waiting threads.
+
+Verification also reports when a stored hash was made with parameters other
+than PASSWORD_HASH_METHOD, and computes the replacement hash in the same
+worker call, so logins upgrade old hashes transparently.
+
+Sign-in goes through Firebase, so no route checks passwords today and
+UserAuth.set_password()/check_password() hash inline. Request handlers that
+take a password should call password_hasher.hash()/verify() instead; the pool
+is only started by the first such call.
+
+Workers are started with the spawn method (forking a threaded server is
+unsafe), which re-imports the entry script and so runs create_app() in every
+worker. create_app() skips migrations and background threads there (see
+in_pool_worker()). A pool whose worker died is replaced on the next call.
+"""
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Werkzeug's current default (scrypt with N=2**15, r=8, p=1)
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when too many hashing calls are already queued"""
+
+
+def in_pool_worker():
+    """True inside a multiprocessing child, e.g. a password pool worker.
+
+    Checked by name because parent_process() is only set after a spawned
+    child has finished importing the entry script.
+    """
+    return multiprocessing.current_process().name != 'MainProcess' or multiprocessing.parent_process() is not None
+
+
+def _hash(password, method):
+    return generate_password_hash(password, method=method)
+
+
+def _verify(pwhash, password, method):
+    """Return (matches, replacement hash or None); runs in a worker process"""
+    if not check_password_hash(pwhash, password):
+        return False, None
+    if pwhash.split('$', 1)[0] != method:
+        return True, generate_password_hash(password, method=method)
+    return True, None
+
+
+class PasswordHasher:
+    """Bounded process pool for password hashing and verification"""
+
+    def __init__(self):
+        self.method = DEFAULT_METHOD
+        self.workers = 2
+        self.timeout = 10
+        self._slots = threading.BoundedSemaphore(16)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.method = app.config.setdefault('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+        self.workers = app.config.setdefault('PASSWORD_HASH_WORKERS', 2)
+        self.timeout = app.config.setdefault('PASSWORD_HASH_TIMEOUT', 10)
+        self._slots = threading.BoundedSemaphore(app.config.setdefault('PASSWORD_HASH_QUEUE', 16))
+
+    def _get_executor(self):
+        if self._executor is None and self.workers > 0:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: forking a threaded server process can copy held locks
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                         mp_context=multiprocessing.get_context('spawn'))
+        return self._executor
+
+    def _discard_executor(self, executor):
+        """Drop a broken pool so the next call starts a fresh one"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("⚠️ Password worker pool broke; restarting it on the next call")
+
+    def _call(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy('Too many password operations in progress')
+        executor = None
+        try:
+            executor = self._get_executor()
+            future = executor.submit(function, *args) if executor is not None else None
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard_executor(executor)
+            raise PasswordHasherBusy('Password worker pool restarting')
+        except BaseException:
+            self._slots.release()
+            raise
+
+        if future is None:
+            # No pool configured: run inline, still bounded by the semaphore
+            try:
+                return function(*args)
+            finally:
+                self._slots.release()
+
+        # The slot stays taken until the worker finishes, even if we stop waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy('Password operation timed out')
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise PasswordHasherBusy('Password worker pool restarting')
+
+    def hash(self, password):
+        return self._call(_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """Return (matches, new_hash); new_hash is set when pwhash should be upgraded"""
+        return self._call(_verify, pwhash, password, self.method)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHasher()
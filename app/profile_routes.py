@@ -1,7 +1,9 @@
 from flask import Blueprint, render_template, jsonify, request, session
-from .models import db, User, QuizResult, UserAchievement
-from datetime import datetime, timedelta
+from .models import db, User, QuizAnswer, QuizResult, UserAchievement, UserDailyActivity, UserQuizStats, UserSeenItems
+from datetime import datetime
 from flask_login import login_required, current_user
+from .leaderboard import forget_user, update_score
+from .user_cache import user_cache
 
 # Create blueprint
 profile_bp = Blueprint('profile', __name__)
@@ -32,7 +34,7 @@ def save_profile():
                 'message': 'User not authenticated'
             }), 401
         
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             return jsonify({
                 'success': False,
@@ -49,6 +51,7 @@ def save_profile():
             pass
         
         db.session.commit()
+        user_cache.invalidate(user_id)
         
         return jsonify({
             'success': True,
@@ -74,23 +77,23 @@ def get_profile_stats():
                 'message': 'User not authenticated'
             }), 401
         
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             return jsonify({
                 'success': False,
                 'message': 'User not found'
             }), 404
         
-        # Calculate real statistics from quiz results
-        quiz_results = QuizResult.query.filter_by(user_id=user_id).all()
-        total_quizzes = len(quiz_results)
+        # Read totals from the stats rollup instead of every quiz result
+        totals = UserQuizStats.for_user(user_id).get(UserQuizStats.ALL)
+        total_quizzes = totals.quiz_count if totals else 0
         
-        # Calculate total study time from quiz attempts
-        total_study_time = sum(quiz.time_taken for quiz in quiz_results) // 60  # Convert to minutes
+        # Total study time from quiz attempts
+        total_study_time = totals.total_time // 60 if totals else 0  # Convert to minutes
         
-        # Calculate accuracy rate from all quizzes
-        total_correct = sum(quiz.correct_answers for quiz in quiz_results)
-        total_questions = sum(quiz.total_questions for quiz in quiz_results)
+        # Accuracy rate across all quizzes
+        total_correct = totals.total_correct if totals else 0
+        total_questions = totals.total_questions if totals else 0
         accuracy_rate = round((total_correct / total_questions * 100), 1) if total_questions > 0 else 0
         
         stats = {
@@ -160,11 +163,11 @@ def get_achievements():
         achievements = []
         
         # Check each achievement type
-        user = User.query.get(user_id)
-        quiz_results = QuizResult.query.filter_by(user_id=user_id).all()
+        user = db.session.get(User, user_id)
+        totals = UserQuizStats.for_user(user_id).get(UserQuizStats.ALL)
         
         # First Steps - completed any quiz
-        first_steps_unlocked = len(quiz_results) > 0
+        first_steps_unlocked = bool(totals and totals.quiz_count > 0)
         first_steps_achievement = user_achievements[0] if user_achievements else None
         
         achievements.append({
@@ -204,7 +207,7 @@ def get_achievements():
         })
         
         # Perfect Score - check quiz results
-        perfect_score_unlocked = any(quiz.percentage == 100 for quiz in quiz_results)
+        perfect_score_unlocked = bool(totals and totals.perfect_count > 0)
         
         achievements.append({
             'id': 4,
@@ -289,14 +292,18 @@ def export_user_data():
                 'message': 'User not authenticated'
             }), 401
         
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             return jsonify({
                 'success': False,
                 'message': 'User not found'
             }), 404
         
-        quiz_results = QuizResult.query.filter_by(user_id=user_id).all()
+        totals = UserQuizStats.for_user(user_id).get(UserQuizStats.ALL)
+        recent_quizzes = QuizResult.query.filter_by(user_id=user_id)\
+            .order_by(QuizResult.timestamp.desc())\
+            .limit(10)\
+            .all()
         user_achievements = UserAchievement.query.filter_by(user_id=user_id).all()
         
         user_data = {
@@ -311,8 +318,8 @@ def export_user_data():
                 'totalSentences': user.sentences_mastered,
                 'streakDays': user.current_streak,
                 'accuracyRate': user.accuracy_rate,
-                'totalQuizzes': len(quiz_results),
-                'totalStudyTime': sum(quiz.time_taken for quiz in quiz_results) // 60
+                'totalQuizzes': totals.quiz_count if totals else 0,
+                'totalStudyTime': totals.total_time // 60 if totals else 0
             },
             'achievements': [
                 {
@@ -326,7 +333,7 @@ def export_user_data():
                     'date': quiz.timestamp.strftime('%Y-%m-%d'),
                     'activity': f'{quiz.quiz_type.title()} Quiz',
                     'score': quiz.percentage
-                } for quiz in quiz_results[:10]  # Last 10 quizzes
+                } for quiz in recent_quizzes  # Last 10 quizzes
             ]
         }
         
@@ -356,34 +363,28 @@ def update_progress():
                 'message': 'User not authenticated'
             }), 401
         
-        user = User.query.get(user_id)
-        if not user:
+        # Update user progress based on quiz results, plus the streak, in one UPDATE
+        values = User.streak_values()
+        for field in ('words_mastered', 'sentences_mastered', 'total_score', 'accuracy_rate'):
+            if field in data:
+                values[field] = data[field]
+        
+        updated = db.session.execute(
+            db.update(User).where(User.id == user_id).values(**values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not updated:
+            db.session.rollback()
             return jsonify({
                 'success': False,
                 'message': 'User not found'
             }), 404
         
-        # Update user progress based on quiz results
-        if 'words_mastered' in data:
-            user.words_mastered = data['words_mastered']
-        if 'sentences_mastered' in data:
-            user.sentences_mastered = data['sentences_mastered']
-        if 'total_score' in data:
-            user.total_score = data['total_score']
-        if 'accuracy_rate' in data:
-            user.accuracy_rate = data['accuracy_rate']
-        
-        # Update streak
-        today = datetime.utcnow().date()
-        last_activity = user.last_activity_date.date() if user.last_activity_date else None
-        
-        if last_activity == today - timedelta(days=1):
-            user.current_streak += 1
-        elif last_activity != today:
-            user.current_streak = 1
-        
-        user.last_activity_date = datetime.utcnow()
         db.session.commit()
+        user_cache.invalidate(user_id)
+        
+        if 'total_score' in data:
+            update_score(user_id, db.session.get(User, user_id).total_score)
         
         return jsonify({
             'success': True,
@@ -413,7 +414,7 @@ def upload_avatar():
         
         user_id = session.get('user_id')
         if user_id:
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if user:
                 # Store avatar data if you add avatar field to User model
                 pass
@@ -444,13 +445,21 @@ def delete_account():
         
         user_id = session.get('user_id')
         if user_id:
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if user:
                 # Delete user data
+                QuizAnswer.query.filter(QuizAnswer.result_id.in_(
+                    db.session.query(QuizResult.id).filter_by(user_id=user_id)
+                )).delete(synchronize_session=False)
                 QuizResult.query.filter_by(user_id=user_id).delete()
+                UserQuizStats.query.filter_by(user_id=user_id).delete()
+                UserDailyActivity.query.filter_by(user_id=user_id).delete()
+                UserSeenItems.query.filter_by(user_id=user_id).delete()
                 UserAchievement.query.filter_by(user_id=user_id).delete()
                 db.session.delete(user)
                 db.session.commit()
+                user_cache.invalidate(user_id)
+                forget_user(user_id)
         
         return jsonify({
             'success': True,
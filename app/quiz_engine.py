@@ -0,0 +1,200 @@
+"""
+Shared quiz builder for the words and sentences blueprints.
+
+Corpus items are immutable, so a quiz never touches them. Options are shuffled
+by picking one of the precomputed permutations for that option count; the new
+position of the correct answer is read from the permutation's inverse instead
+of searching the shuffled list.
+
+Quizzes handed to clients are seeded: the seed, the corpus version and the
+question count fully determine the questions, so the server can rebuild a quiz
+for grading from a signed quiz token instead of trusting client-side scores.
+Server-graded quizzes (?grading=server) are served without correctAnswer, and
+only they carry a quiz token.
+"""
+import hashlib
+from itertools import permutations
+import json
+import random
+import secrets
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from .distractors import DISTRACTOR_MODES, get_distractor_engine
+
+# Largest option count whose permutations are precomputed (6! = 720 entries)
+MAX_PRECOMPUTED_OPTIONS = 6
+
+_permutation_tables = {}
+
+
+def get_permutation_table(option_count):
+    """Return (permutations, inverses) for the given number of options"""
+    table = _permutation_tables.get(option_count)
+    if table is None:
+        perms = tuple(permutations(range(option_count)))
+        inverses = tuple(
+            tuple(perm.index(original) for original in range(option_count))
+            for perm in perms
+        )
+        table = (perms, inverses)
+        _permutation_tables[option_count] = table
+    return table
+
+
+def shuffle_options(item, rng=random):
+    """Return (options, correct_index) for the item with its options shuffled"""
+    option_count = len(item.options)
+
+    if option_count <= MAX_PRECOMPUTED_OPTIONS:
+        perms, inverses = get_permutation_table(option_count)
+        choice = rng.randrange(len(perms))
+        perm = perms[choice]
+        correct = inverses[choice][item.correct]
+    else:
+        perm = list(range(option_count))
+        rng.shuffle(perm)
+        correct = perm.index(item.correct)
+
+    return [item.options[i] for i in perm], correct
+
+
+def build_question(item, rng=random):
+    """Build one quiz question payload from a corpus item"""
+    question = item.to_dict()
+    question['options'], question['correctAnswer'] = shuffle_options(item, rng)
+    return question
+
+
+def build_quiz(items, count, rng=random, distractors=None):
+    """Sample up to `count` items and build a question for each.
+
+    With a DistractorEngine, the hand-typed options are replaced by distractors
+    drawn from the corpus for the whole quiz at once.
+    """
+    selected = rng.sample(items, min(count, len(items)))
+    if distractors is not None:
+        selected = distractors.with_distractors(selected, rng)
+    return [build_question(item, rng) for item in selected]
+
+
+# Query values for ?grading=: 'client' pages check answers themselves,
+# 'server' quizzes omit the answers and are graded from their token
+GRADING_MODES = ('client', 'server')
+
+
+def strip_answers(questions):
+    """Return questions without correctAnswer, for quizzes the server grades"""
+    return [{key: value for key, value in question.items() if key != 'correctAnswer'}
+            for question in questions]
+
+
+def new_seed():
+    """Return a fresh random quiz seed"""
+    return secrets.randbits(48)
+
+
+def build_seeded_quiz(items, count, seed, distractors=None):
+    """Build a quiz whose item selection and option order depend only on `seed`"""
+    return build_quiz(items, count, random.Random(seed), distractors)
+
+
+def build_pinned_quiz(items, seed, distractors=None):
+    """Build questions for an already-chosen list of items with seeded option order"""
+    rng = random.Random(seed)
+    if distractors is not None:
+        items = distractors.with_distractors(items, rng)
+    return [build_question(item, rng) for item in items]
+
+
+def get_distractors(corpus, mode):
+    """Return the distractor engine for a ?distractors= mode (None keeps the stored options)"""
+    if mode is None:
+        return None
+    if mode not in DISTRACTOR_MODES:
+        raise ValueError(f"Unknown distractors mode '{mode}'")
+    return get_distractor_engine(corpus)
+
+
+# ==================== QUIZ TOKENS ====================
+
+QUIZ_TOKEN_SALT = 'quiz-token'
+
+
+class QuizTokenError(ValueError):
+    """Raised for quiz tokens that are malformed, tampered with or expired"""
+
+
+def _token_serializer():
+    return URLSafeTimedSerializer(current_app.secret_key, salt=QUIZ_TOKEN_SALT)
+
+
+def make_quiz_token(kind, version, seed, count, item_ids=None, distractors=None):
+    """Sign everything needed to rebuild a quiz.
+
+    Random quizzes only need (version, seed, count). Quizzes whose items were
+    chosen some other way (e.g. skipping seen items) carry their item ids.
+    """
+    spec = {'k': kind, 'v': version, 's': seed, 'n': count}
+    if item_ids is not None:
+        spec['ids'] = list(item_ids)
+    if distractors is not None:
+        spec['d'] = distractors
+    return _token_serializer().dumps(spec)
+
+
+def load_quiz_token(token):
+    """Verify a quiz token and return its spec dict"""
+    max_age = current_app.config.get('QUIZ_TOKEN_MAX_AGE', 86400)
+    try:
+        return _token_serializer().loads(token, max_age=max_age)
+    except BadSignature as e:
+        raise QuizTokenError('Invalid or expired quiz token') from e
+
+
+def quiz_token_digest(spec):
+    """Stable hash of a token spec; one graded result is allowed per user and digest"""
+    canonical = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def rebuild_quiz(corpus, spec):
+    """Rebuild the questions described by a token spec against the given corpus"""
+    distractors = get_distractors(corpus, spec.get('d'))
+    if 'ids' in spec:
+        items, missing = corpus.get_many(spec['ids'])
+        if missing:
+            raise QuizTokenError(f'Quiz references unknown item ids: {missing}')
+        return build_pinned_quiz(items, spec['s'], distractors)
+    return build_seeded_quiz(corpus.items, spec['n'], spec['s'], distractors)
+
+
+def grade_answers(questions, answers):
+    """Grade chosen option indices against rebuilt questions.
+
+    `answers` holds one chosen index (or None when unanswered) per question.
+    Returns (correct_count, per-question results).
+    """
+    if len(answers) > len(questions):
+        raise ValueError(f'Got {len(answers)} answers for {len(questions)} questions')
+
+    results = []
+    correct_count = 0
+    for position, question in enumerate(questions):
+        chosen = answers[position] if position < len(answers) else None
+        if chosen is not None and (not isinstance(chosen, int) or isinstance(chosen, bool)):
+            raise ValueError(f'Answer {position} must be an option index or null')
+        is_correct = chosen == question['correctAnswer']
+        correct_count += is_correct
+        results.append({
+            'id': question['id'],
+            'chosen': chosen,
+            'correct_answer': question['correctAnswer'],
+            'is_correct': is_correct
+        })
+    return correct_count, results
+
+
+# Warm the table for the standard four-option questions
+get_permutation_table(4)
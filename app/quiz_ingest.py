@@ -0,0 +1,122 @@
+"""
+Single write path for finished quizzes.
+
+Every save endpoint (client-reported results and server-graded quizzes) goes
+through ingest_result(), which in one transaction:
+- inserts the QuizResult and its answers
+- folds it into the UserQuizStats and UserDailyActivity rollups
+- updates the user's score, mastered counts, accuracy and streak
+and then drops the user's cached snapshot and moves them in the in-process
+leaderboards.
+
+Accuracy is read from the rollup, so a save does O(1) work no matter how long
+the user's history is. Counters on stored rows are written as SQL increments
+(col = col + n), so concurrent saves for the same user don't lose updates.
+"""
+from datetime import datetime
+
+from .corpus import KINDS, get_corpus
+from .leaderboard import record_quiz_score
+from .models import db, QuizAnswer, QuizResult, User, UserDailyActivity, UserQuizStats
+from .user_cache import user_cache
+
+
+class QuizResultError(ValueError):
+    """Raised when a submitted quiz result fails validation"""
+
+
+REQUIRED_FIELDS = ('quiz_type', 'score', 'total_questions', 'correct_answers',
+                   'incorrect_answers', 'percentage')
+
+# Points awarded per correct answer (same as the quiz pages)
+POINTS_PER_CORRECT = 10
+
+# Largest gap allowed between a reported percentage and the one the counts give
+# (the pages round to whole percents)
+PERCENTAGE_TOLERANCE = 1.0
+
+
+def build_result(user_id, data):
+    """Validate a client-reported result payload and return an unsaved QuizResult.
+
+    Score and percentage are recomputed from the answer counts; reported values
+    that disagree with them are rejected.
+    """
+    if not isinstance(data, dict):
+        raise QuizResultError('Expected a JSON object')
+
+    for field in REQUIRED_FIELDS:
+        if field not in data:
+            raise QuizResultError(f'Missing field: {field}')
+
+    if data['quiz_type'] not in KINDS:
+        raise QuizResultError(f"quiz_type must be one of: {', '.join(KINDS)}")
+
+    try:
+        score = int(data['score'])
+        total_questions = int(data['total_questions'])
+        correct_answers = int(data['correct_answers'])
+        incorrect_answers = int(data['incorrect_answers'])
+        percentage = float(data['percentage'])
+        time_taken = int(data.get('time_taken') or 0)
+    except (TypeError, ValueError):
+        raise QuizResultError('Numeric fields must be numbers')
+
+    if min(score, total_questions, correct_answers, incorrect_answers, time_taken) < 0:
+        raise QuizResultError('Numeric fields must not be negative')
+    if total_questions == 0:
+        raise QuizResultError('total_questions must be at least 1')
+    if total_questions > len(get_corpus(data['quiz_type'])):
+        raise QuizResultError('total_questions exceeds the number of quiz items')
+    if correct_answers + incorrect_answers > total_questions:
+        raise QuizResultError('correct_answers + incorrect_answers exceeds total_questions')
+
+    expected_score = correct_answers * POINTS_PER_CORRECT
+    if score != expected_score:
+        raise QuizResultError(f'score must be {POINTS_PER_CORRECT} points per correct answer')
+    expected_percentage = round(correct_answers / total_questions * 100, 1)
+    if abs(percentage - expected_percentage) > PERCENTAGE_TOLERANCE:
+        raise QuizResultError('percentage does not match correct_answers / total_questions')
+
+    try:
+        QuizAnswer.normalize(data.get('user_answers'))
+    except ValueError as e:
+        raise QuizResultError(str(e))
+
+    return QuizResult(
+        quiz_type=data['quiz_type'],
+        score=expected_score,
+        total_questions=total_questions,
+        correct_answers=correct_answers,
+        incorrect_answers=incorrect_answers,
+        percentage=expected_percentage,
+        time_taken=time_taken,
+        user_id=user_id,
+        timestamp=datetime.utcnow()
+    )
+
+
+def ingest_result(quiz_result, answers=None):
+    """Save a QuizResult with its answers, rollups and user progress in one commit"""
+    try:
+        db.session.add(quiz_result)
+        if answers is not None:
+            quiz_result.store_answers(answers)
+
+        UserQuizStats.record(quiz_result)
+        UserDailyActivity.record(quiz_result)
+
+        user = db.session.get(User, quiz_result.user_id) if quiz_result.user_id else None
+        if user is not None:
+            user.update_stats(quiz_result)
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if user is not None:
+        user_cache.invalidate(user.id)
+        record_quiz_score(user.id, user.total_score, quiz_result)
+
+    return quiz_result
@@ -0,0 +1,101 @@
+"""
+Background pre-generation of randomized quizzes.
+
+A producer thread keeps a bounded ring buffer of ready-made, already
+serialized quiz payloads for every (kind, size) pair in QUIZ_POOL_SIZES.
+Requests pop a finished payload instead of sampling and building one on the
+request thread. Sizes outside the pool, and an empty buffer, fall back to
+building synchronously.
+"""
+from collections import deque
+import json
+import threading
+
+from .corpus import get_corpus
+
+
+class QuizPool:
+    """Ring buffers of pre-serialized quiz payloads, refilled by a daemon thread"""
+
+    def __init__(self):
+        self.app = None
+        self.capacity = 8
+        self.sizes = frozenset()
+        self._builders = {}
+        self._buffers = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.capacity = app.config.setdefault('QUIZ_POOL_CAPACITY', 8)
+        self.sizes = frozenset(app.config.setdefault('QUIZ_POOL_SIZES', (20, 50)))
+
+    def register(self, kind, builder):
+        """Register builder(count) -> payload dict for a corpus kind"""
+        self._builders[kind] = builder
+
+    def build(self, kind, count):
+        """Build and serialize one quiz payload; returns (corpus_version, body_bytes)"""
+        version = get_corpus(kind).version
+        payload = self._builders[kind](count)
+        return version, json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def take(self, kind, count):
+        """Return one serialized quiz, preferring a pre-generated one"""
+        return self.take_many(kind, count, 1)[0]
+
+    def take_many(self, kind, count, n):
+        """Return `n` serialized quizzes of the same kind and size"""
+        bodies = []
+        if count in self.sizes and self.capacity > 0:
+            version = get_corpus(kind).version
+            with self._cond:
+                buffer = self._buffers.setdefault((kind, count), deque(maxlen=self.capacity))
+                while buffer and len(bodies) < n:
+                    entry_version, body = buffer.popleft()
+                    if entry_version == version:
+                        bodies.append(body)
+                self._cond.notify()
+            self._ensure_producer()
+
+        while len(bodies) < n:
+            bodies.append(self.build(kind, count)[1])
+        return bodies
+
+    def _ensure_producer(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._cond:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name='quiz-pool', daemon=True)
+                    self._thread.start()
+
+    def _next_underfilled(self):
+        for key, buffer in self._buffers.items():
+            if len(buffer) < self.capacity:
+                return key
+        return None
+
+    def _run(self):
+        """Producer loop: top up whichever buffer is below capacity"""
+        with self.app.app_context():
+            while True:
+                with self._cond:
+                    key = self._next_underfilled()
+                    while key is None:
+                        self._cond.wait(timeout=30)
+                        key = self._next_underfilled()
+
+                try:
+                    entry = self.build(*key)
+                except Exception as e:
+                    print(f"❌ Quiz pool error building {key}: {str(e)}")
+                    with self._cond:
+                        self._cond.wait(timeout=5)
+                    continue
+
+                with self._cond:
+                    self._buffers[key].append(entry)
+
+
+quiz_pool = QuizPool()
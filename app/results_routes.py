@@ -1,8 +1,13 @@
 from flask import Blueprint, jsonify, request, session
 from flask_login import login_required, current_user
-from datetime import datetime
+from datetime import date, datetime, timedelta
+import base64
 import json
-from .models import db, QuizResult, User
+from sqlalchemy.exc import IntegrityError
+from .models import db, QuizAnswer, QuizResult, User, UserDailyActivity, UserQuizStats
+from .corpus import KINDS, get_corpus, parse_item_ids
+from .quiz_engine import QuizTokenError, grade_answers, load_quiz_token, quiz_token_digest, rebuild_quiz
+from .quiz_ingest import POINTS_PER_CORRECT, QuizResultError, build_result, ingest_result
 import uuid
 
 results_bp = Blueprint('results', __name__)
@@ -25,85 +30,225 @@ def save_quiz_result():
     }
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
+        quiz_result = build_result(current_user.id, data)
+    except QuizResultError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
+        # Result, answers, rollups and user progress are saved in one transaction
+        ingest_result(quiz_result, data.get('user_answers'))
+        
+        return jsonify({
+            'success': True,
+            'message': 'Quiz result saved successfully',
+            'quiz_id': quiz_result.id,
+            'timestamp': quiz_result.timestamp.isoformat()
+        }), 201
         
-        # Validate required fields
-        required_fields = ['quiz_type', 'score', 'total_questions', 'correct_answers', 
-                         'incorrect_answers', 'percentage']
+    except Exception as e:
+        print(f"Error saving quiz result: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def parse_timings(data):
+    """Validate the optional latencies (ms per question) and time_taken (seconds) of a submission"""
+    latencies = data.get('latencies')
+    if latencies is None:
+        latencies = []
+    if not isinstance(latencies, list) or not all(
+            latency is None or (isinstance(latency, (int, float)) and not isinstance(latency, bool) and latency >= 0)
+            for latency in latencies):
+        raise ValueError('latencies must be a list of non-negative numbers')
+    
+    time_taken = data.get('time_taken')
+    if time_taken is None:
+        time_taken = 0
+    if not isinstance(time_taken, int) or isinstance(time_taken, bool) or time_taken < 0:
+        raise ValueError('time_taken must be a non-negative integer')
+    
+    return [None if latency is None else int(latency) for latency in latencies], time_taken
+
+
+@results_bp.route('/api/grade-quiz', methods=['POST'])
+@login_required
+def grade_quiz():
+    """
+    Grade a quiz on the server and save the result
+    Expects JSON with: {
+        quiz_token: token returned with the quiz,
+        answers: array of chosen option indices (null when unanswered),
+        latencies: array of per-question answer times in ms (optional),
+        time_taken: number (in seconds, optional)
+    }
+    The questions are rebuilt from the token's seed and corpus version, so
+    the score never comes from the client. Each token is graded once per user.
+    """
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        spec = load_quiz_token(data.get('quiz_token', ''))
+        answers = data.get('answers')
+        if not isinstance(answers, list):
+            return jsonify({'success': False, 'error': 'Missing field: answers'}), 400
+        latencies, time_taken = parse_timings(data)
+    except (QuizTokenError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    if spec.get('k') not in KINDS:
+        return jsonify({'success': False, 'error': 'Invalid quiz type'}), 400
+    
+    token_hash = quiz_token_digest(spec)
+    if QuizResult.query.filter_by(user_id=current_user.id, quiz_token_hash=token_hash).first():
+        return jsonify({'success': False, 'error': 'This quiz has already been graded'}), 409
+    
+    try:
+        corpus = get_corpus(spec['k'])
+        if corpus.version != spec['v']:
+            return jsonify({
+                'success': False,
+                'error': 'Quiz was generated from an older corpus and can no longer be graded',
+                'corpus_version': corpus.version
+            }), 409
         
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'success': False, 'error': f'Missing field: {field}'}), 400
+        questions = rebuild_quiz(corpus, spec)
+        correct_count, graded = grade_answers(questions, answers)
         
-        # Create quiz result
+        # Optional per-question answer times from the client
+        for position, entry in enumerate(graded):
+            entry['latency_ms'] = latencies[position] if position < len(latencies) else None
+    except (QuizTokenError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
+        total_questions = len(questions)
         quiz_result = QuizResult(
-            quiz_type=data['quiz_type'],
-            score=int(data['score']),
-            total_questions=int(data['total_questions']),
-            correct_answers=int(data['correct_answers']),
-            incorrect_answers=int(data['incorrect_answers']),
-            percentage=float(data['percentage']),
-            time_taken=int(data.get('time_taken', 0)),
+            quiz_type=spec['k'],
+            score=correct_count * POINTS_PER_CORRECT,
+            total_questions=total_questions,
+            correct_answers=correct_count,
+            incorrect_answers=total_questions - correct_count,
+            percentage=round(correct_count / total_questions * 100, 1) if total_questions else 0,
+            time_taken=time_taken,
             user_id=current_user.id,
-            timestamp=datetime.utcnow()
+            timestamp=datetime.utcnow(),
+            quiz_token_hash=token_hash
         )
-        
-        # Store user answers if provided
-        if 'user_answers' in data:
-            quiz_result.set_user_answers(data['user_answers'])
-        
-        # Add to database
-        db.session.add(quiz_result)
-        db.session.commit()
-        
-        # Update user stats
-        if hasattr(current_user, 'update_stats'):
-            current_user.update_stats(quiz_result)
+        try:
+            ingest_result(quiz_result, graded)
+        except IntegrityError:
+            # Only idx_quiz_user_token means a concurrent submission of the same token won;
+            # any other constraint failure is a real error
+            if QuizResult.query.filter_by(user_id=current_user.id, quiz_token_hash=token_hash).first() is None:
+                raise
+            return jsonify({'success': False, 'error': 'This quiz has already been graded'}), 409
         
         return jsonify({
             'success': True,
-            'message': 'Quiz result saved successfully',
+            'message': 'Quiz graded and saved successfully',
             'quiz_id': quiz_result.id,
-            'timestamp': quiz_result.timestamp.isoformat()
+            'timestamp': quiz_result.timestamp.isoformat(),
+            'score': quiz_result.score,
+            'total_questions': total_questions,
+            'correct_answers': correct_count,
+            'incorrect_answers': quiz_result.incorrect_answers,
+            'percentage': quiz_result.percentage,
+            'results': graded
         }), 201
         
     except Exception as e:
-        db.session.rollback()
-        print(f"Error saving quiz result: {str(e)}")
+        print(f"Error grading quiz: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# Largest page /api/quiz-results returns
+MAX_RESULTS_PAGE = 100
+
+# Fields /api/quiz-results can return; user_answers is only loaded when requested
+RESULT_FIELDS = ('id', 'quiz_type', 'score', 'total_questions', 'correct_answers',
+                 'incorrect_answers', 'percentage', 'time_taken', 'user_answers',
+                 'timestamp', 'date', 'time')
+DEFAULT_RESULT_FIELDS = tuple(field for field in RESULT_FIELDS if field != 'user_answers')
+
+
+def encode_results_cursor(result):
+    """Opaque cursor pointing just past `result` in (timestamp desc, id desc) order"""
+    raw = f'{result.timestamp.isoformat()}|{result.id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_results_cursor(cursor):
+    """Return (timestamp, id) from encode_results_cursor(); raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        timestamp, result_id = raw.split('|')
+        return datetime.fromisoformat(timestamp), int(result_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
 @results_bp.route('/api/quiz-results', methods=['GET'])
 @login_required
 def get_quiz_results():
     """
-    Get all quiz results for current user
+    Get quiz results for current user, most recent first
     Optional query params:
     - quiz_type: filter by 'words' or 'sentences'
-    - limit: number of results to return (default 50)
-    - offset: pagination offset (default 0)
+    - limit: number of results to return (default 50, max 100)
+    - cursor: next_cursor from the previous page
+    - fields: comma-separated fields to return (default: all but user_answers)
+    Pages are keyset-paginated on (timestamp, id), so every page costs the same.
+    `total` comes from the stats rollup and is approximate.
     """
     try:
         quiz_type = request.args.get('quiz_type', None)
-        limit = request.args.get('limit', 50, type=int)
-        offset = request.args.get('offset', 0, type=int)
+        limit = max(1, min(request.args.get('limit', 50, type=int), MAX_RESULTS_PAGE))
+        cursor = request.args.get('cursor')
+        after = decode_results_cursor(cursor) if cursor else None
         
+        fields = DEFAULT_RESULT_FIELDS
+        if request.args.get('fields'):
+            fields = tuple(dict.fromkeys(field.strip() for field in request.args['fields'].split(',') if field.strip()))
+            unknown = [field for field in fields if field not in RESULT_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        with_answers = 'user_answers' in fields
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
         # Build query
         query = QuizResult.query.filter_by(user_id=current_user.id)
         
         if quiz_type:
             query = query.filter_by(quiz_type=quiz_type)
         
-        # Get total count before pagination
-        total = query.count()
+        # Seek past the last row of the previous page
+        if after:
+            after_timestamp, after_id = after
+            query = query.filter(db.or_(
+                QuizResult.timestamp < after_timestamp,
+                db.and_(QuizResult.timestamp == after_timestamp, QuizResult.id < after_id)
+            ))
         
-        # Get paginated results sorted by most recent first
-        results = query.order_by(QuizResult.timestamp.desc()).limit(limit).offset(offset).all()
+        # The answers blob is only read when the caller asks for it
+        if not with_answers:
+            query = query.options(db.defer(QuizResult.user_answers))
+        
+        # One extra row tells us whether another page exists
+        results = query.order_by(QuizResult.timestamp.desc(), QuizResult.id.desc()).limit(limit + 1).all()
+        has_more = len(results) > limit
+        results = results[:limit]
+        
+        # Normalized answers for the whole page in one query
+        answers = {}
+        if with_answers:
+            answers = QuizAnswer.for_results([result.id for result in results if not result.user_answers])
         
         # Convert to JSON-serializable format
         results_data = []
         for result in results:
-            results_data.append({
+            row = {
                 'id': result.id,
                 'quiz_type': result.quiz_type,
                 'score': result.score,
@@ -112,19 +257,26 @@ def get_quiz_results():
                 'incorrect_answers': result.incorrect_answers,
                 'percentage': result.percentage,
                 'time_taken': result.time_taken,
-                'user_answers': result.get_user_answers(),
                 'timestamp': result.timestamp.isoformat(),
                 'date': result.timestamp.strftime('%Y-%m-%d'),
                 'time': result.timestamp.strftime('%H:%M:%S')
-            })
+            }
+            if with_answers:
+                row['user_answers'] = json.loads(result.user_answers) if result.user_answers else answers.get(result.id, [])
+            results_data.append({field: row[field] for field in fields})
+        
+        # Approximate total from the rollup instead of COUNT(*)
+        stats = UserQuizStats.for_user(current_user.id).get(quiz_type or UserQuizStats.ALL)
         
         return jsonify({
             'success': True,
             'data': results_data,
-            'total': total,
+            'total': stats.quiz_count if stats else 0,
+            'total_is_approximate': True,
             'limit': limit,
-            'offset': offset,
-            'returned': len(results_data)
+            'returned': len(results_data),
+            'has_more': has_more,
+            'next_cursor': encode_results_cursor(results[-1]) if has_more else None
         }), 200
         
     except Exception as e:
@@ -177,15 +329,10 @@ def get_quiz_stats():
     try:
         quiz_type = request.args.get('quiz_type', None)
         
-        # Build query
-        query = QuizResult.query.filter_by(user_id=current_user.id)
+        # Single-row read from the rollup maintained on every save
+        stats = UserQuizStats.for_user(current_user.id).get(quiz_type or UserQuizStats.ALL)
         
-        if quiz_type:
-            query = query.filter_by(quiz_type=quiz_type)
-        
-        results = query.all()
-        
-        if not results:
+        if not stats:
             return jsonify({
                 'success': True,
                 'data': {
@@ -196,33 +343,14 @@ def get_quiz_stats():
                     'best_score': 0,
                     'worst_score': 0,
                     'total_correct': 0,
-                    'total_incorrect': 0
+                    'total_incorrect': 0,
+                    'accuracy_rate': 0
                 }
             }), 200
         
-        # Calculate statistics
-        total_quizzes = len(results)
-        total_score = sum(r.score for r in results)
-        total_percentage = sum(r.percentage for r in results)
-        total_time = sum(r.time_taken for r in results)
-        best_score = max(r.score for r in results)
-        worst_score = min(r.score for r in results)
-        total_correct = sum(r.correct_answers for r in results)
-        total_incorrect = sum(r.incorrect_answers for r in results)
-        
         return jsonify({
             'success': True,
-            'data': {
-                'total_quizzes': total_quizzes,
-                'average_score': round(total_score / total_quizzes, 2),
-                'average_percentage': round(total_percentage / total_quizzes, 2),
-                'total_time': total_time,
-                'best_score': best_score,
-                'worst_score': worst_score,
-                'total_correct': total_correct,
-                'total_incorrect': total_incorrect,
-                'accuracy_rate': round((total_correct / (total_correct + total_incorrect) * 100), 2) if (total_correct + total_incorrect) > 0 else 0
-            }
+            'data': stats.to_dict()
         }), 200
         
     except Exception as e:
@@ -266,3 +394,131 @@ def get_results_by_date():
     except Exception as e:
         print(f"Error fetching results by date: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# Longest range the heatmap endpoint serves in one response
+MAX_HEATMAP_DAYS = 366
+
+
+@results_bp.route('/api/activity/heatmap', methods=['GET'])
+@login_required
+def get_activity_heatmap():
+    """
+    Get per-day quiz activity for a calendar heatmap
+    Optional query params:
+    - start: first day, YYYY-MM-DD (default 364 days before end)
+    - end: last day, YYYY-MM-DD (default today, UTC)
+    - quiz_type: only count 'words' or 'sentences'
+    Served from the daily rollup; quiz_results is not read. History from before
+    the rollup appears after `flask backfill-activity` or the user's next save.
+    """
+    quiz_type = request.args.get('quiz_type', None)
+    if quiz_type is not None and quiz_type not in KINDS:
+        return jsonify({'success': False, 'error': 'quiz_type must be words or sentences'}), 400
+    
+    try:
+        end = date.fromisoformat(request.args['end']) if request.args.get('end') else datetime.utcnow().date()
+        start = date.fromisoformat(request.args['start']) if request.args.get('start') else end - timedelta(days=MAX_HEATMAP_DAYS - 2)
+    except ValueError:
+        return jsonify({'success': False, 'error': 'start and end must be YYYY-MM-DD dates'}), 400
+    
+    if start > end or (end - start).days >= MAX_HEATMAP_DAYS:
+        return jsonify({'success': False, 'error': f'Date range must be between 1 and {MAX_HEATMAP_DAYS} days'}), 400
+    
+    try:
+        query = UserDailyActivity.query.filter(
+            UserDailyActivity.user_id == current_user.id,
+            UserDailyActivity.date >= start,
+            UserDailyActivity.date <= end
+        )
+        if quiz_type:
+            query = query.filter(UserDailyActivity.quiz_type == quiz_type)
+        
+        # Merge quiz types into one entry per active day
+        days = {}
+        for row in query.order_by(UserDailyActivity.date).all():
+            day = days.setdefault(row.date.isoformat(), {
+                'quizzes': 0,
+                'score': 0,
+                'correct_answers': 0,
+                'total_questions': 0,
+                'time_taken': 0,
+                'by_type': {}
+            })
+            day['quizzes'] += row.quiz_count
+            day['score'] += row.total_score
+            day['correct_answers'] += row.total_correct
+            day['total_questions'] += row.total_questions
+            day['time_taken'] += row.total_time
+            day['by_type'][row.quiz_type] = row.quiz_count
+        
+        return jsonify({
+            'success': True,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'active_days': len(days),
+            'total_quizzes': sum(day['quizzes'] for day in days.values()),
+            'days': days
+        }), 200
+        
+    except Exception as e:
+        print(f"Error fetching activity heatmap: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@results_bp.route('/api/item-stats', methods=['GET'])
+@login_required
+def get_item_stats():
+    """
+    Get the current user's per-item answer statistics
+    Query params:
+    - quiz_type: 'words' or 'sentences' (default 'words')
+    - ids: optional comma-separated item ids to restrict to
+    - limit: number of items to return (default 50, max 200), hardest first
+    """
+    try:
+        quiz_type = request.args.get('quiz_type', 'words')
+        if quiz_type not in KINDS:
+            raise ValueError('quiz_type must be words or sentences')
+        item_ids = parse_item_ids(request.args.get('ids')) if request.args.get('ids') else None
+        limit = max(1, min(request.args.get('limit', 50, type=int), 200))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
+        attempts = db.func.count(QuizAnswer.item_id)
+        correct = db.func.sum(db.case((QuizAnswer.correct, 1), else_=0))
+        accuracy = correct * 1.0 / attempts
+        
+        query = db.session.query(
+            QuizAnswer.item_id,
+            attempts,
+            correct,
+            db.func.avg(QuizAnswer.latency_ms)
+        ).join(QuizResult, QuizResult.id == QuizAnswer.result_id)\
+            .filter(QuizResult.user_id == current_user.id, QuizAnswer.kind == quiz_type)
+        
+        if item_ids:
+            query = query.filter(QuizAnswer.item_id.in_(item_ids))
+        
+        rows = query.group_by(QuizAnswer.item_id)\
+            .order_by(accuracy.asc(), attempts.desc(), QuizAnswer.item_id)\
+            .limit(limit).all()
+        
+        items = [{
+            'item_id': item_id,
+            'attempts': item_attempts,
+            'correct': int(item_correct or 0),
+            'accuracy': round((item_correct or 0) / item_attempts * 100, 1),
+            'avg_latency_ms': round(float(avg_latency)) if avg_latency is not None else None
+        } for item_id, item_attempts, item_correct, avg_latency in rows]
+        
+        return jsonify({
+            'success': True,
+            'quiz_type': quiz_type,
+            'items': items
+        }), 200
+        
+    except Exception as e:
+        print(f"Error fetching item stats: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,214 @@
+"""
+In-memory inverted index over the corpus for word and sentence search.
+
+Every item is indexed under three kinds of terms:
+- hanzi unigrams and bigrams ("h:" terms)
+- tone-stripped pinyin syllables ("p:" terms)
+- lightly stemmed English tokens ("e:" terms)
+
+Queries are analyzed the same way and results are ranked by summed IDF weight.
+The last query token can be treated as a prefix for autocomplete; expansions
+score below an exact match of the token (see prefix_factor()).
+"""
+from bisect import bisect_left
+import math
+import re
+import threading
+import unicodedata
+
+from .corpus import get_corpus
+
+# ==================== ANALYZERS ====================
+
+CJK_RUN = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+')
+LATIN_TOKEN = re.compile(r"[a-z0-9]+")
+
+_INITIALS = ('', 'b', 'p', 'm', 'f', 'd', 't', 'n', 'l', 'g', 'k', 'h', 'j', 'q', 'x',
+             'zh', 'ch', 'sh', 'r', 'z', 'c', 's', 'y', 'w')
+_FINALS = ('a', 'o', 'e', 'i', 'u', 'v', 'ai', 'ei', 'ao', 'ou', 'an', 'en', 'ang', 'eng',
+           'ong', 'er', 'ia', 'ie', 'iao', 'iu', 'ian', 'in', 'iang', 'ing', 'iong', 'ua',
+           'uo', 'uai', 'ui', 'uan', 'un', 'uang', 've', 'van', 'vn', 'ue')
+
+# Superset of valid toneless syllables; good enough to split joined pinyin like "bantian"
+PINYIN_SYLLABLES = frozenset(initial + final for initial in _INITIALS for final in _FINALS)
+MAX_SYLLABLE_LENGTH = max(len(syllable) for syllable in PINYIN_SYLLABLES)
+
+_STOPWORDS = frozenset(('a', 'an', 'the', 'to', 'of', 'is', 'are', 'am', 'be'))
+
+
+def strip_tones(text):
+    """Lowercase pinyin and drop tone marks (ü becomes v)"""
+    text = text.lower().replace('ü', 'v').replace('u:', 'v')
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def segment_pinyin(chunk):
+    """Split joined toneless pinyin into syllables, or return [chunk] if it does not parse"""
+    # best[i] holds a segmentation of chunk[:i] with the fewest syllables
+    best = [None] * (len(chunk) + 1)
+    best[0] = []
+    for end in range(1, len(chunk) + 1):
+        for start in range(max(0, end - MAX_SYLLABLE_LENGTH), end):
+            if best[start] is not None and chunk[start:end] in PINYIN_SYLLABLES:
+                candidate = best[start] + [chunk[start:end]]
+                if best[end] is None or len(candidate) < len(best[end]):
+                    best[end] = candidate
+    return best[-1] or [chunk]
+
+
+def stem_english(token):
+    """Very small suffix stripper so 'teachers'/'teaching' match 'teacher'/'teach'"""
+    for suffix, replacement in (('ies', 'y'), ('ing', ''), ('ed', ''), ('es', ''), ('s', '')):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)] + replacement
+    return token
+
+
+def hanzi_terms(text):
+    terms = []
+    for run in CJK_RUN.findall(text):
+        terms.extend('h:' + ch for ch in run)
+        terms.extend('h:' + run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def pinyin_terms(text):
+    terms = []
+    for chunk in LATIN_TOKEN.findall(strip_tones(text)):
+        terms.extend('p:' + syllable for syllable in segment_pinyin(chunk))
+    return terms
+
+
+def english_terms(text):
+    return ['e:' + stem_english(token) for token in LATIN_TOKEN.findall(text.lower().replace("'", ''))
+            if token not in _STOPWORDS]
+
+
+# ==================== INDEX ====================
+
+class SearchIndex:
+    """Inverted index over one corpus"""
+
+    # Per-field weight multipliers applied on top of IDF
+    FIELD_BOOST = {'h': 1.5, 'p': 1.0, 'e': 1.0}
+
+    # Cap on terms a prefix may expand to
+    MAX_PREFIX_EXPANSION = 50
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+        self.version = corpus.version
+        self.items = corpus.items
+
+        postings = {}
+        for position, item in enumerate(self.items):
+            terms = set(hanzi_terms(item.hanzi))
+            terms.update(pinyin_terms(item.pinyin))
+            terms.update(english_terms(item.english))
+            for term in terms:
+                postings.setdefault(term, []).append(position)
+
+        total = max(len(self.items), 1)
+        self.postings = {term: tuple(positions) for term, positions in postings.items()}
+        self.weights = {
+            term: self.FIELD_BOOST[term[0]] * (1.0 + math.log(total / len(positions)))
+            for term, positions in self.postings.items()
+        }
+        # Sorted vocabulary for prefix lookups
+        self.vocabulary = sorted(self.postings)
+
+    def expand_prefix(self, term):
+        """Return vocabulary terms starting with `term` (including term itself)"""
+        start = bisect_left(self.vocabulary, term)
+        expanded = []
+        for candidate in self.vocabulary[start:start + self.MAX_PREFIX_EXPANSION]:
+            if not candidate.startswith(term):
+                break
+            expanded.append(candidate)
+        return expanded
+
+    def prefix_factor(self, term, expanded):
+        """Score multiplier for a prefix expansion of `term`.
+
+        Scaled by how much of the expanded term was typed, and capped so the
+        expansion never outscores `term` itself: rare expansions have a higher
+        IDF than the exact term, and "ni" should find 你 before 您 or 牛奶.
+        """
+        if expanded == term:
+            return 1.0
+        factor = (len(term) - 2) / (len(expanded) - 2)  # without the "p:"/"e:" field prefix
+        if term in self.weights:
+            factor *= min(1.0, self.weights[term] / self.weights[expanded])
+        return factor
+
+    def analyze_query(self, query, prefix=True):
+        """Split a query into groups of alternatives.
+
+        Each group is one query token; each alternative is a (terms, factor) pair:
+        terms an item must all contain (e.g. the syllables of "bantian") and a
+        multiplier for their summed weight. An item's score for a group is its
+        best matching alternative.
+        """
+        groups = [[((term,), 1.0)] for term in hanzi_terms(query)]
+
+        latin = LATIN_TOKEN.findall(strip_tones(query))
+        for position, token in enumerate(latin):
+            alternatives = {tuple('p:' + syllable for syllable in segment_pinyin(token)): 1.0}
+            if token not in _STOPWORDS:
+                alternatives[('e:' + stem_english(token),)] = 1.0
+
+            if prefix and position == len(latin) - 1:
+                # Autocomplete: "zhon" -> "p:zhong", "teach" -> "e:teacher"
+                for term in ('p:' + token, 'e:' + token):
+                    for expanded in self.expand_prefix(term):
+                        factor = self.prefix_factor(term, expanded)
+                        if factor > alternatives.get((expanded,), 0.0):
+                            alternatives[(expanded,)] = factor
+
+            groups.append(list(alternatives.items()))
+        return groups
+
+    def match_alternative(self, terms, factor=1.0):
+        """Return {position: score} for items containing every term"""
+        if any(term not in self.postings for term in terms):
+            return {}
+        positions = set(self.postings[terms[0]])
+        for term in terms[1:]:
+            positions.intersection_update(self.postings[term])
+        score = factor * sum(self.weights[term] for term in terms)
+        return dict.fromkeys(positions, score)
+
+    def search(self, query, limit=20, prefix=True):
+        """Return up to `limit` items ranked by relevance"""
+        scores = {}
+        for group in self.analyze_query(query, prefix):
+            group_scores = {}
+            for terms, factor in group:
+                for position, score in self.match_alternative(terms, factor).items():
+                    if score > group_scores.get(position, 0):
+                        group_scores[position] = score
+            for position, score in group_scores.items():
+                scores[position] = scores.get(position, 0) + score
+
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1], self.items[entry[0]].id))
+        return [self.items[position] for position, _ in ranked[:limit]]
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_search_index(kind):
+    """Return the search index for a corpus kind, rebuilding it when the corpus version changes"""
+    corpus = get_corpus(kind)
+    index = _indexes.get(kind)
+    if index is not None and index.version == corpus.version:
+        return index
+
+    with _lock:
+        index = _indexes.get(kind)
+        if index is None or index.version != corpus.version:
+            index = SearchIndex(corpus)
+            _indexes[kind] = index
+    return index
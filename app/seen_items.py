@@ -0,0 +1,99 @@
+"""
+Per-user "seen items" tracking for the next-quiz endpoints.
+
+Seen item ids are kept as a bitset (bit N set means item id N was served).
+Logged-in users have it stored server-side in `user_seen_items`, so it follows
+them across devices. Anonymous users carry it in the session cookie as a short
+base64 token instead of a list of ids.
+"""
+import base64
+from datetime import datetime
+import zlib
+
+from flask import session
+from flask_login import current_user
+
+from .models import db, UserSeenItems, upsert
+
+# Session key prefix for anonymous users' tokens
+SESSION_KEY = 'seen_{kind}'
+
+# Legacy session keys that held plain id lists
+LEGACY_SESSION_KEYS = {
+    'words': 'used_word_ids',
+    'sentences': 'used_sentence_ids'
+}
+
+
+class SeenSet:
+    """Bitset of item ids with O(1) membership checks"""
+
+    def __init__(self, data=b''):
+        self.bits = bytearray(data)
+
+    def __contains__(self, item_id):
+        byte = item_id >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (item_id & 7)))
+
+    def add(self, item_id):
+        byte = item_id >> 3
+        if byte >= len(self.bits):
+            self.bits.extend(b'\x00' * (byte + 1 - len(self.bits)))
+        self.bits[byte] |= 1 << (item_id & 7)
+
+    def update(self, item_ids):
+        for item_id in item_ids:
+            self.add(item_id)
+
+    def clear(self):
+        self.bits = bytearray()
+
+    def __len__(self):
+        return sum(bin(byte).count('1') for byte in self.bits)
+
+    def to_bytes(self):
+        return bytes(self.bits.rstrip(b'\x00'))
+
+    def to_token(self):
+        """Encode as a compact URL-safe string ('z' prefix when zlib-compressed)"""
+        raw = self.to_bytes()
+        compressed = zlib.compress(raw, 9)
+        if len(compressed) < len(raw):
+            return 'z' + base64.urlsafe_b64encode(compressed).decode().rstrip('=')
+        return 'r' + base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def from_token(cls, token):
+        """Decode a token from to_token(); malformed tokens give an empty set"""
+        if not token:
+            return cls()
+        try:
+            payload = base64.urlsafe_b64decode(token[1:] + '=' * (-len(token[1:]) % 4))
+            if token[0] == 'z':
+                payload = zlib.decompress(payload)
+            return cls(payload)
+        except (ValueError, zlib.error):
+            return cls()
+
+
+def load_seen(kind):
+    """Load the current user's seen-set for 'words' or 'sentences'"""
+    session.pop(LEGACY_SESSION_KEYS[kind], None)
+
+    if current_user.is_authenticated:
+        row = db.session.get(UserSeenItems, (current_user.id, kind))
+        return SeenSet(row.bits if row else b'')
+
+    return SeenSet.from_token(session.get(SESSION_KEY.format(kind=kind)))
+
+
+def save_seen(kind, seen):
+    """Persist the seen-set server-side for logged-in users, else in the session cookie"""
+    if current_user.is_authenticated:
+        # Upsert, so two tabs saving a user's first set for a kind can't collide
+        values = {'bits': seen.to_bytes(), 'updated_at': datetime.utcnow()}
+        upsert(UserSeenItems, dict(values, user_id=current_user.id, kind=kind), values)
+        db.session.commit()
+        return
+
+    session[SESSION_KEY.format(kind=kind)] = seen.to_token()
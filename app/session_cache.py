@@ -0,0 +1,119 @@
+"""
+In-memory cache of validated login sessions.
+
+validate_session() used to query UserSession on every page view. A token that
+was found active is now remembered for SESSION_CACHE_TTL seconds, so repeat
+views skip the database.
+
+Revocations (a new login elsewhere, logout, revoke_all_sessions) must reach
+every worker process. Each one writes the revocation time to a small marker
+file named after the user in the SESSION_REVOCATION_DIR instance directory.
+A cached entry rechecks its own user's marker at most once per
+SESSION_REVOCATION_CHECK seconds and is dropped if the marker is newer than
+the database check that cached it. Other users' sessions stay cached. A
+revoked session is therefore rejected everywhere within
+SESSION_REVOCATION_CHECK seconds, and anything revoked behind the app's back
+within SESSION_CACHE_TTL. Markers older than that are pruned by the session
+reaper.
+"""
+from datetime import datetime, timedelta
+import os
+import re
+import threading
+import time
+
+# Sessions older than this are expired by validate_session()
+SESSION_MAX_AGE = timedelta(hours=24)
+
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_-]')
+
+
+class SessionCache:
+    """Recently validated session tokens, dropped when their user's sessions are revoked"""
+
+    def __init__(self):
+        self.ttl = 30
+        self.check_interval = 1.0
+        self.directory = None
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.setdefault('SESSION_CACHE_TTL', 30)
+        self.check_interval = app.config.setdefault('SESSION_REVOCATION_CHECK', 1.0)
+        self.directory = app.config.setdefault('SESSION_REVOCATION_DIR',
+                                               os.path.join(app.instance_path, 'revoked-sessions'))
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _marker_path(self, user_auth_id):
+        return os.path.join(self.directory, _UNSAFE_FILENAME.sub('_', str(user_auth_id)))
+
+    def _revoked_at(self, user_auth_id):
+        """Wall-clock time of the user's last revocation, or None"""
+        try:
+            with open(self._marker_path(user_auth_id), encoding='utf-8') as f:
+                return float(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def is_active(self, session_token, user_auth_id):
+        """True if the token was validated recently, belongs to this user and hasn't been revoked or aged out"""
+        if self.directory is None:
+            return False
+        entry = self._entries.get(session_token)
+        if entry is None:
+            return False
+        expires_at, owner_id, login_time, validated_at, checked_at = entry
+        now = time.monotonic()
+        if now >= expires_at or owner_id != user_auth_id:
+            return False
+
+        if now - checked_at >= self.check_interval:
+            revoked_at = self._revoked_at(owner_id)
+            with self._lock:
+                if revoked_at is not None and revoked_at >= validated_at:
+                    self._entries.pop(session_token, None)
+                    return False
+                if self._entries.get(session_token) is entry:
+                    self._entries[session_token] = (expires_at, owner_id, login_time, validated_at, now)
+
+        return datetime.utcnow() - login_time < SESSION_MAX_AGE
+
+    def remember(self, session_token, user_auth_id, login_time, validated_at):
+        """Cache a session the database confirmed as active by a query started at `validated_at` (time.time())"""
+        if self.directory is None or self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._entries[session_token] = (now + self.ttl, user_auth_id, login_time, validated_at, now)
+
+    def notify_revoked(self, user_auth_id):
+        """Call after committing a revocation of the user's sessions: clear them here and signal the other workers"""
+        if self.directory is None:
+            return
+        path = self._marker_path(user_auth_id)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(repr(time.time()))
+        os.replace(tmp_path, path)
+        with self._lock:
+            for session_token in [token for token, entry in self._entries.items() if entry[1] == user_auth_id]:
+                del self._entries[session_token]
+
+    def prune_markers(self):
+        """Delete markers too old to affect any cached entry; returns the count"""
+        if self.directory is None:
+            return 0
+        cutoff = time.time() - self.ttl - self.check_interval
+        removed = 0
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+session_cache = SessionCache()
@@ -0,0 +1,67 @@
+"""
+Background pruning of the user_sessions table.
+
+Every login adds a UserSession row and nothing used to remove them, so the
+table and its (token, is_active) / (user, is_active) indexes grew forever. A
+daemon thread now runs every SESSION_REAPER_INTERVAL seconds and:
+- deactivates active sessions older than SESSION_MAX_AGE
+- deletes sessions that ended more than SESSION_RETENTION_DAYS ago
+in batches of SESSION_REAPER_BATCH rows, one commit per batch, so no single
+statement holds locks on a large range. It also removes session cache
+revocation markers that can no longer matter. `flask prune-sessions` runs the same
+pass by hand.
+"""
+from datetime import timedelta
+import random
+import threading
+
+from .models import db, UserSession
+from .session_cache import session_cache
+
+
+class SessionReaper:
+    """Daemon thread that expires and deletes old UserSession rows"""
+
+    def __init__(self):
+        self.app = None
+        self.interval = 3600
+        self.retention = timedelta(days=7)
+        self.batch_size = 500
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.interval = app.config.setdefault('SESSION_REAPER_INTERVAL', 3600)
+        self.retention = timedelta(days=app.config.setdefault('SESSION_RETENTION_DAYS', 7))
+        self.batch_size = app.config.setdefault('SESSION_REAPER_BATCH', 500)
+        if self.interval > 0:
+            self.start()
+
+    def run_once(self):
+        """Expire and prune sessions; returns (expired, deleted). Needs an app context."""
+        expired = UserSession.expire_stale(self.batch_size)
+        deleted = UserSession.prune(self.retention, self.batch_size)
+        session_cache.prune_markers()
+        return expired, deleted
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='session-reaper', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        wait = threading.Event().wait
+        while True:
+            # Jitter keeps several workers from pruning at the same moment
+            wait(self.interval * random.uniform(0.9, 1.1))
+            with self.app.app_context():
+                try:
+                    expired, deleted = self.run_once()
+                    if expired or deleted:
+                        print(f"🧹 Session reaper: expired {expired}, deleted {deleted}")
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"❌ Session reaper error: {str(e)}")
+
+
+session_reaper = SessionReaper()
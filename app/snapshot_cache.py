@@ -0,0 +1,134 @@
+"""
+Cross-process, single-flight snapshot cache.
+
+Expensive shared views (the top-50 leaderboard, community stats) are computed
+by one worker and written as JSON files under the instance directory, so every
+process in the pool reads the same snapshot. A snapshot is fresh for its TTL;
+once it expires, the first worker to create NAME.lock with O_EXCL rebuilds it
+while every other request keeps serving the previous file. A lock left by a
+crashed worker is broken after LOCK_TIMEOUT seconds.
+
+invalidate() marks a snapshot expired by resetting its mtime, so the next
+request rebuilds it and concurrent requests still get the old copy meanwhile.
+"""
+import json
+import os
+import threading
+import time
+
+
+class SnapshotCache:
+    """JSON snapshots shared through files, rebuilt by one worker at a time"""
+
+    # Seconds after which a lock file is assumed abandoned
+    LOCK_TIMEOUT = 30
+
+    # How long a request with no snapshot to fall back on waits for the builder
+    WAIT_TIMEOUT = 5
+
+    def __init__(self):
+        self.directory = None
+        self.ttl = 10
+        self._memo = {}
+        self._memo_lock = threading.Lock()
+
+    def init_app(self, app):
+        self.directory = app.config.setdefault('SNAPSHOT_DIR', os.path.join(app.instance_path, 'snapshots'))
+        self.ttl = app.config.setdefault('SNAPSHOT_TTL', 10)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f'{name}.json')
+
+    def _read(self, name):
+        """Return (mtime, data) for a stored snapshot, or (None, None); parsed files are memoized by mtime"""
+        path = self._path(name)
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None, None
+
+        memo = self._memo.get(name)
+        if memo is not None and memo[0] == mtime:
+            return memo
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+
+        with self._memo_lock:
+            self._memo[name] = (mtime, data)
+        return mtime, data
+
+    def _write(self, name, data):
+        path = self._path(name)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def _acquire(self, name):
+        """Try to take the rebuild lock for a snapshot; True if this worker holds it"""
+        lock_path = os.path.join(self.directory, f'{name}.lock')
+        for _ in range(2):
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_path).st_mtime < self.LOCK_TIMEOUT:
+                        return False
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+        return False
+
+    def _release(self, name):
+        try:
+            os.remove(os.path.join(self.directory, f'{name}.lock'))
+        except FileNotFoundError:
+            pass
+
+    def get(self, name, builder, ttl=None):
+        """Return the snapshot `name`, rebuilding it with builder() when expired.
+
+        Only the worker holding the lock calls builder(); others get the stale
+        snapshot, or wait up to WAIT_TIMEOUT for the first one to be written.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        mtime, data = self._read(name)
+        if mtime is not None and time.time() - mtime < ttl:
+            return data
+
+        deadline = time.monotonic() + self.WAIT_TIMEOUT
+        while True:
+            if self._acquire(name):
+                try:
+                    data = builder()
+                    self._write(name, data)
+                    return data
+                finally:
+                    self._release(name)
+
+            if mtime is not None:
+                return data
+
+            # Nothing to serve yet: wait for the builder, or build it ourselves on timeout
+            time.sleep(0.05)
+            mtime, data = self._read(name)
+            if mtime is not None:
+                return data
+            if time.monotonic() > deadline:
+                return builder()
+
+    def invalidate(self, name):
+        """Expire a snapshot in every process; it is rebuilt on the next request"""
+        try:
+            os.utime(self._path(name), (0, 0))
+        except FileNotFoundError:
+            pass
+
+
+snapshots = SnapshotCache()
@@ -0,0 +1,78 @@
+"""
+Per-process cache of resolved users for the Flask-Login user_loader.
+
+Resolving a session id used to take up to three queries per request (UserAuth,
+its lazy user relationship, then User). The resolved row is now kept as a
+detached snapshot in a small LRU with a short TTL, and each request gets it
+back with session.merge(load=False), which attaches it to the request's
+session without any SQL. Later db.session.get(User, id) calls in the same
+request are answered from the session's identity map.
+
+Writes to a user's profile or score call invalidate(); other worker processes
+pick up the change when their copy's TTL runs out.
+"""
+from collections import OrderedDict
+import threading
+import time
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from .models import db, User
+
+
+class UserCache:
+    """LRU of detached User snapshots keyed by session id, each valid for `ttl` seconds.
+
+    The session id is whatever Flask-Login stored: a User id, or a UserAuth id
+    for sessions created before users were linked to their auth rows.
+    """
+
+    def __init__(self):
+        self.ttl = 30
+        self.max_size = 1024
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.setdefault('USER_CACHE_TTL', 30)
+        self.max_size = app.config.setdefault('USER_CACHE_SIZE', 1024)
+
+    def get(self, session_id):
+        """Return the cached user attached to the current session, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+        return db.session.merge(snapshot, load=False)
+
+    def put(self, session_id, user):
+        """Remember the user a session id resolved to, as a detached copy of its columns"""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        snapshot = User(**{column.key: getattr(user, column.key) for column in User.__mapper__.column_attrs})
+        make_transient_to_detached(snapshot)
+
+        with self._lock:
+            self._entries[session_id] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        """Drop every session entry that resolves to this user"""
+        with self._lock:
+            for session_id in [session_id for session_id, (_, snapshot) in self._entries.items()
+                               if snapshot.id == user_id]:
+                del self._entries[session_id]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache()
@@ -0,0 +1,172 @@
+"""
+Local Firebase ID token verification against a stand-in JWKS endpoint.
+
+Tokens are signed with locally generated RSA keys; the endpoint serves their
+public halves the way Google's does (a JWKS document with Cache-Control).
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask import Flask
+
+from app.firebase_tokens import FirebaseTokenVerifier
+
+PROJECT_ID = 'hsk-test-project'
+
+
+def make_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def public_jwk(private_key, kid):
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, alg='RS256', use='sig')
+    return jwk
+
+
+class JWKSServer:
+    """Serves whatever `body` currently holds at /jwks and counts the requests"""
+
+    def __init__(self):
+        self.body = b'{"keys": []}'
+        self.max_age = 3600
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Cache-Control', f'public, max-age={server.max_age}, must-revalidate')
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/jwks'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def publish(self, *jwks):
+        self.body = json.dumps({'keys': list(jwks)}).encode()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(scope='module')
+def signing_key():
+    return make_key()
+
+
+@pytest.fixture
+def jwks(signing_key):
+    server = JWKSServer()
+    server.publish(public_jwk(signing_key, 'key-1'))
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def verifier(jwks):
+    app = Flask(__name__)
+    app.config.update(
+        FIREBASE_PROJECT_ID=PROJECT_ID,
+        FIREBASE_API_KEY='test-api-key',
+        FIREBASE_JWKS_URL=jwks.url,
+        FIREBASE_REMOTE_VERIFY=True
+    )
+    verifier = FirebaseTokenVerifier()
+    verifier.init_app(app)
+    return verifier
+
+
+def make_token(private_key, kid='key-1', algorithm='RS256', **overrides):
+    now = int(time.time())
+    claims = {
+        'iss': f'https://securetoken.google.com/{PROJECT_ID}',
+        'aud': PROJECT_ID,
+        'sub': 'firebase-uid-123',
+        'iat': now - 10,
+        'exp': now + 3600,
+        'auth_time': now - 10,
+        'email': 'learner@example.com',
+        'email_verified': True
+    }
+    claims.update(overrides)
+    claims = {name: value for name, value in claims.items() if value is not None}
+    return jwt.encode(claims, private_key, algorithm=algorithm, headers={'kid': kid})
+
+
+def test_valid_token_is_mapped_to_lookup_shape(verifier, signing_key):
+    assert verifier.verify(make_token(signing_key)) == {
+        'localId': 'firebase-uid-123',
+        'email': 'learner@example.com',
+        'emailVerified': True
+    }
+
+
+def test_keys_are_cached_for_max_age(verifier, jwks, signing_key):
+    for _ in range(3):
+        assert verifier.verify(make_token(signing_key)) is not None
+    assert jwks.requests == 1
+
+
+@pytest.mark.parametrize('overrides', [
+    {'aud': 'some-other-project'},
+    {'iss': 'https://securetoken.google.com/some-other-project'},
+    {'exp': int(time.time()) - 3600, 'iat': int(time.time()) - 7200},
+    {'sub': ''},
+    {'sub': None},
+    {'auth_time': int(time.time()) + 3600},
+], ids=['audience', 'issuer', 'expired', 'empty-subject', 'missing-subject', 'future-auth-time'])
+def test_bad_claims_are_rejected_without_remote_lookup(verifier, signing_key, monkeypatch, overrides):
+    monkeypatch.setattr(verifier, 'verify_remotely', lambda token: pytest.fail('remote lookup used'))
+    assert verifier.verify(make_token(signing_key, **overrides)) is None
+
+
+def test_wrong_signature_is_rejected(verifier, monkeypatch):
+    monkeypatch.setattr(verifier, 'verify_remotely', lambda token: pytest.fail('remote lookup used'))
+    assert verifier.verify(make_token(make_key())) is None
+
+
+def test_hs256_token_is_rejected(verifier, monkeypatch):
+    monkeypatch.setattr(verifier, 'verify_remotely', lambda token: pytest.fail('remote lookup used'))
+    token = make_token('a-shared-secret-that-is-long-enough-for-hs256', algorithm='HS256')
+    assert verifier.verify(token) is None
+
+
+def test_rotated_key_is_fetched_once_per_interval(verifier, jwks, signing_key):
+    assert verifier.verify(make_token(signing_key)) is not None
+
+    rotated = make_key()
+    jwks.publish(public_jwk(signing_key, 'key-1'), public_jwk(rotated, 'key-2'))
+    assert verifier.verify(make_token(rotated, kid='key-2')) is not None
+    assert jwks.requests == 2
+
+    # Unknown kids don't trigger another fetch within MIN_FORCED_REFRESH_INTERVAL
+    assert verifier.verify(make_token(make_key(), kid='key-3')) is None
+    assert jwks.requests == 2
+
+
+@pytest.mark.parametrize('body', [b'<html>Service Unavailable</html>', b'[]', b'{"keys": "nope"}'],
+                         ids=['not-json', 'not-an-object', 'keys-not-a-list'])
+def test_malformed_jwks_falls_back_to_remote_lookup(verifier, jwks, signing_key, monkeypatch, body):
+    jwks.body = body
+    remote_user = {'localId': 'firebase-uid-123', 'email': 'learner@example.com', 'emailVerified': True}
+    monkeypatch.setattr(verifier, 'verify_remotely', lambda token: remote_user)
+    assert verifier.verify(make_token(signing_key)) == remote_user
+
+
+def test_malformed_jwks_without_remote_fallback_rejects(verifier, jwks, signing_key):
+    jwks.body = b'not json'
+    verifier.remote_fallback = False
+    assert verifier.verify(make_token(signing_key)) is None